@@ -176,14 +176,14 @@ def _aggregate_metrics(
         results: dict[Metric, list[MetricResult]],
         forest: AggregateForest[CategoricalAggregateNode, MetricResult],
     ) -> None:
-        for metric in results:
+        for metric, metric_results in results.items():
             if isinstance(metric, Numerical):
                 continue
             elif isinstance(metric, Categorical):
                 aggregate_node = CategoricalAggregateNode(
                     name=f"Aggregate/{metric.name}",
                     metric=metric,
-                    children=[val.identifier for val in results[metric]],
+                    children=[val.identifier for val in metric_results],
                     forest=forest,
                 )
 
@@ -147,8 +147,7 @@ def _aggregate_metrics(
         results: dict[LLMMetric, list[LLMMetricResult]],
         forest: AggregateForest[LLMInferenceAggregateNode, LLMMetricResult],
     ) -> None:
-        for metric in results:
-            metric_results = results[metric]
+        for metric, metric_results in results.items():
             values: dict[tuple[str, str, int], list[LLMMetricResult]] = defaultdict(
                 list
             )
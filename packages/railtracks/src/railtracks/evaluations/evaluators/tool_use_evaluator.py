@@ -184,24 +184,22 @@ def _aggregate_per_run(
         metric_results = results[METRICS["Runtime"]]
         metric_results_by_adp_id: dict[UUID, list[ToolMetricResult]] = defaultdict(list)
 
-        values: dict[UUID, dict[str, list[ToolMetricResult]]] = defaultdict(dict)
-
         for result in metric_results:
             for adp_id in result.agent_data_id:
                 metric_results_by_adp_id[adp_id].append(result)
 
-        for adp_id in metric_results_by_adp_id:
-            values[adp_id] = defaultdict(list)
+        for adp_results in metric_results_by_adp_id.values():
+            by_tool: dict[str, list[ToolMetricResult]] = defaultdict(list)
 
-            for tmr in metric_results_by_adp_id[adp_id]:
-                values[adp_id][tmr.tool_name].append(tmr)
+            for tmr in adp_results:
+                by_tool[tmr.tool_name].append(tmr)
 
-            for tool_name in values[adp_id]:
+            for tool_name, tool_results in by_tool.items():
                 aggregate_node = ToolAggregateNode(
                     name=f"Aggregate/{METRICS['Runtime'].name}",
                     metric=METRICS["Runtime"],
                     tool_name=tool_name,
-                    children=[tmr.identifier for tmr in values[adp_id][tool_name]],
+                    children=[tmr.identifier for tmr in tool_results],
                     forest=forest,
                 )
                 forest.roots.append(aggregate_node.identifier)
@@ -252,14 +250,12 @@ def _aggregate_across_runs(
             if agg.metric == METRICS["Runtime"]:
                 tool_breakdown[agg.tool_name].append(agg)
 
-        for tool_name in tool_breakdown:
+        for tool_name, tool_aggs in tool_breakdown.items():
             parent = ToolAggregateNode(
                 name=f"Aggregate/{METRICS['Runtime'].name}",
                 metric=METRICS["Runtime"],
                 tool_name=tool_name,
-                children=[
-                    tool_agg.identifier for tool_agg in tool_breakdown[tool_name]
-                ],
+                children=[tool_agg.identifier for tool_agg in tool_aggs],
                 forest=forest,
             )
             forest.add_node(parent)
@@ -101,10 +101,9 @@ class PIIEngine:
     def __init__(self, config: PIIRedactConfig) -> None:
         self._patterns: list[tuple[re.Pattern[str], str, str]] = []
         entity_set = set(config.entities)
-        for entity in _BUILTIN_PATTERNS:
+        for entity, raw in _BUILTIN_PATTERNS.items():
             if entity not in entity_set:
                 continue
-            raw = _BUILTIN_PATTERNS[entity]
             self._patterns.append((re.compile(raw), entity.value, f"[{entity.value}]"))
         for cp in config.custom_patterns:
             self._patterns.append((re.compile(cp.regex), cp.name, f"[{cp.name}]"))
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from copy import copy
 
 from railtracks.guardrails.core.decision import GuardrailDecision
 from railtracks.guardrails.core.event import LLMGuardrailEvent
@@ -55,7 +55,9 @@ def __call__(self, event: LLMGuardrailEvent) -> GuardrailDecision:
             if records:
                 all_records.extend(records)
                 messages_affected += 1
-                clone = deepcopy(msg)
+                # Shallow copy: only _content is replaced; attachments and other
+                # fields are shared with the original rather than duplicated.
+                clone = copy(msg)
                 clone._content = redacted_text
                 new_messages.append(clone)
             else:
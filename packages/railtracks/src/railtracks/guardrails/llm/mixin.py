@@ -20,6 +20,24 @@
 from ..core.event import LLMGuardrailEvent, LLMGuardrailPhase
 from ..core.trace import GuardrailTrace
 
+# Checked in order; the first rule whose markers all occur in the lower-cased
+# node class name decides the ``agent_kind`` tag. Unmatched classes are "llm".
+_AGENT_KIND_RULES: tuple[tuple[tuple[str, ...], str], ...] = (
+    (("structured", "toolcall"), "structured_tool_call"),
+    (("toolcall",), "tool_call"),
+    (("structured",), "structured"),
+    (("terminal",), "terminal"),
+)
+
+
+def _agent_kind(cls: type) -> str:
+    """Classify a node class by name using ``_AGENT_KIND_RULES``."""
+    name = cls.__name__.lower()
+    for markers, kind in _AGENT_KIND_RULES:
+        if all(marker in name for marker in markers):
+            return kind
+    return "llm"
+
 
 class LLMGuardrailsMixin:
     """Mixin for nodes that invoke an LLM.
@@ -49,16 +67,7 @@ def _append_guard_traces(self, traces: list[GuardrailTrace]) -> None:
         self._details["guard_details"].extend(traces)
 
     def _guardrail_agent_kind(self) -> str:
-        cls_name = self.__class__.__name__.lower()
-        if "structured" in cls_name and "toolcall" in cls_name:
-            return "structured_tool_call"
-        if "toolcall" in cls_name:
-            return "tool_call"
-        if "structured" in cls_name:
-            return "structured"
-        if "terminal" in cls_name:
-            return "terminal"
-        return "llm"
+        return _agent_kind(self.__class__)
 
     def _resolve_model_metadata(self) -> tuple[str | None, str | None]:
         model_name = getattr(self.llm_model, "model_name", None)
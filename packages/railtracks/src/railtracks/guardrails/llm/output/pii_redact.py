@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from copy import copy
 
 from railtracks.guardrails.core.decision import GuardrailDecision
 from railtracks.guardrails.core.event import LLMGuardrailEvent
@@ -47,7 +47,9 @@ def __call__(self, event: LLMGuardrailEvent) -> GuardrailDecision:
         if not records:
             return GuardrailDecision.allow(reason="No PII detected in output.")
 
-        clone = deepcopy(msg)
+        # Shallow copy: only _content is replaced; the remaining fields are
+        # shared with the original rather than duplicated.
+        clone = copy(msg)
         clone._content = redacted_text
         return GuardrailDecision.transform_output(
             output_message=clone,
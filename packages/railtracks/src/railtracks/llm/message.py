@@ -272,6 +272,9 @@ def validate_content(cls, content: str):
             raise TypeError(f"A {cls.__name__} needs a string but got {type(content)}")
 
     def fill_prompt(self, value_dict: ValueDict) -> None:
+        # Content without any braces has no placeholders or escapes to process.
+        if "{" not in self._content and "}" not in self._content:
+            return
         self._content = KeyOnlyFormatter().vformat(self._content, (), value_dict)
 
 
@@ -20,6 +20,12 @@ class AzureAIError(ModelError):
 
 
 class AzureAILLM(LiteLLMWrapper[_TStream]):
+    # Lower-cased copy of ``litellm.azure_ai_models`` shared by all instances,
+    # rebuilt only when the registry's contents change (compared as a set, so
+    # a same-sized replacement still invalidates it).
+    _known_models: frozenset[str] = frozenset()
+    _known_models_source: frozenset[str] | None = None
+
     @classmethod
     def model_gateway(cls):
         return ModelProvider.AZUREAI
@@ -51,7 +57,7 @@ def __init__(
         )
 
         # Currently matching names to Azure models is case sensitive
-        self._available_models = [model.lower() for model in litellm.azure_ai_models]
+        self._available_models = self._available_model_names()
         self._is_model_available()
 
         self.logger = logger
@@ -75,13 +81,22 @@ def chat_with_tools(self, messages, tools, **kwargs):
                 reason=f"Azure AI LLM error while processing the request: {e}"
             ) from e
 
+    @classmethod
+    def _available_model_names(cls) -> frozenset[str]:
+        """Return the lower-cased Azure AI model names known to litellm."""
+        source = frozenset(litellm.azure_ai_models)
+        if source != cls._known_models_source:
+            cls._known_models = frozenset(model.lower() for model in source)
+            cls._known_models_source = source
+        return cls._known_models
+
     def _is_model_available(self) -> None:
         """Check if the model is available and supports tool calling."""
         if self._model_name.lower() not in self._available_models:
             raise AzureAIError(
                 reason=(
                     f"Model '{self._model_name}' is not available. "
-                    f"Available models: {self._available_models}"
+                    f"Available models: {sorted(self._available_models)}"
                 )
             )
 
@@ -1,11 +1,22 @@
 import string
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def _parse_template(format_string: str) -> tuple:
+    return tuple(string.Formatter().parse(format_string))
 
 
 class KeyOnlyFormatter(string.Formatter):
     """
     A simple formatter which will only use keyword arguments to fill placeholders.
+
+    Parsed templates are cached, so prompts that are filled on every request are only parsed once.
     """
 
+    def parse(self, format_string):
+        return _parse_template(format_string)
+
     def get_value(self, key, args, kwargs):
         try:
             return kwargs[str(key)]
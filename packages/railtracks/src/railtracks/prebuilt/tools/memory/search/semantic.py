@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 
 from railtracks.retrieval.embedding.base import Embedding
@@ -70,8 +71,15 @@ def __init__(
         self._embedding = embedding
         self._backend = backend if backend is not None else InMemoryBackend()
 
-    async def _sync_index(self, items: dict[str, str]) -> None:
-        """Bring the vector index in line with ``items``, embedding only the delta."""
+    async def _sync_index(
+        self, items: dict[str, str], query: str | None = None
+    ) -> list[float] | None:
+        """Bring the vector index in line with ``items``, embedding only the delta.
+
+        When ``query`` is given and there is a delta to embed, the query is
+        appended to that same embedding call and its vector is returned, saving
+        a second round-trip to the provider. Returns ``None`` otherwise.
+        """
         indexed = {
             key: payload.get("fingerprint")
             for key, payload in await self._backend.list_where({}, _INDEX_SCAN_LIMIT)
@@ -83,19 +91,55 @@ async def _sync_index(self, items: dict[str, str]) -> None:
         stale = [key for key in indexed if key not in items]
         changed = [key for key in items if indexed.get(key) != fingerprints[key]]
 
-        for key in stale:
-            await self._backend.delete(key)
-
-        if changed:
-            vectors = (
-                await self._embedding.aembed([texts[k] for k in changed])
-            ).vectors
-            for key, vector in zip(changed, vectors):
-                await self._backend.upsert(
-                    key,
-                    vector,
-                    {"value": items[key], "fingerprint": fingerprints[key]},
-                )
+        if stale:
+            # delete_many is optional on VectorBackend, like upsert_many: one
+            # round-trip (and one snapshot flush) for every stale key.
+            delete_many = getattr(self._backend, "delete_many", None)
+            if delete_many is not None:
+                await delete_many(stale)
+            else:
+                # Deletes are independent, so issue them concurrently: a remote
+                # backend pays one round-trip of latency instead of one per key.
+                await asyncio.gather(*(self._backend.delete(key) for key in stale))
+
+        if not changed:
+            return None
+
+        batch = [texts[k] for k in changed]
+        if query is not None:
+            batch.append(query)
+        vectors = await self._embed_batch(batch)
+        rows = [
+            (key, vector, {"value": items[key], "fingerprint": fingerprints[key]})
+            for key, vector in zip(changed, vectors)
+        ]
+        # upsert_many is optional on VectorBackend; InMemoryBackend uses it
+        # to flush its snapshot once for the whole delta.
+        upsert_many = getattr(self._backend, "upsert_many", None)
+        if upsert_many is not None:
+            await upsert_many(rows)
+        else:
+            for key, vector, payload in rows:
+                await self._backend.upsert(key, vector, payload)
+        return vectors[-1] if query is not None else None
+
+    async def _embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed ``texts`` in as few provider calls as the embedder allows.
+
+        A first sync over a large store can exceed what a provider accepts in
+        one request, so the batch is split at the embedder's
+        ``default_batch_size`` (when it declares one). Slices are embedded one
+        after another rather than all at once, so a large delta does not trade
+        the request-size limit for a burst of simultaneous provider calls.
+        Vectors come back in input order.
+        """
+        size = self._embedding.default_batch_size
+        if size is None or len(texts) <= size:
+            return (await self._embedding.aembed(texts)).vectors
+        vectors: list[list[float]] = []
+        for i in range(0, len(texts), size):
+            vectors.extend((await self._embedding.aembed(texts[i : i + size])).vectors)
+        return vectors
 
     async def search(
         self, items: dict[str, str], query: str, *, top_k: int = 5
@@ -107,10 +151,11 @@ async def search(
         # its vectors from the index rather than leaving them orphaned. Only
         # then short-circuit: with nothing indexed there is nothing to match,
         # so skip the pointless query embedding.
-        await self._sync_index(items)
+        query_vector = await self._sync_index(items, query)
         if not items:
             return []
 
-        query_vector = (await self._embedding.aembed([query])).vectors[0]
+        if query_vector is None:
+            query_vector = (await self._embedding.aembed([query])).vectors[0]
         hits = await self._backend.search(query_vector, top_k, {})
         return [(key, payload["value"], score) for key, score, payload in hits]
@@ -1,16 +1,24 @@
 """Chunking subsystem initialization.
 
 Exposes public chunker types and their base abstractions for use in retrieval pipelines.
+
+``SemanticChunker`` is imported on first access: it pulls in scikit-learn,
+which dominates the import time of the retrieval package otherwise.
 """
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .base import Chunker, Splitter
 from .fixed_token import FixedTokenChunker, TiktokenTokenizer, Tokenizer
 from .identity import IdentityChunker
 from .markdown import MarkdownHeaderChunker
 from .recursive import RecursiveCharacterChunker, RecursiveSplitter
-from .semantic_chunker import SemanticChunker
 from .sentence import RegexSentenceSplitter, SentenceChunker
 
+if TYPE_CHECKING:
+    from .semantic_chunker import SemanticChunker
+
 __all__ = [
     "Chunker",
     "FixedTokenChunker",
@@ -25,3 +33,12 @@
     "TiktokenTokenizer",
     "Tokenizer",
 ]
+
+
+def __getattr__(name: str):
+    if name == "SemanticChunker":
+        module = importlib.import_module(f"{__name__}.semantic_chunker")
+        value = module.SemanticChunker
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
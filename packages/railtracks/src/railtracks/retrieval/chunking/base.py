@@ -249,19 +249,21 @@ def _make_chunks(
                 f"pieces length ({len(pieces)})"
             )
 
-        chunks: list[Chunk] = []
-        for i, piece in enumerate(pieces):
-            metadata = dict(document.metadata)
-            if extra_metadata is not None:
-                metadata.update(extra_metadata[i])
-            chunks.append(
-                Chunk(
-                    content=piece,
-                    document_id=document.id,
-                    index=i,
-                    parent_chunk_id=parent_chunk_id,
-                    offsets=offsets[i] if offsets is not None else None,
-                    metadata=metadata,
-                )
+        # Every chunk gets its own dict (callers mutate chunk metadata
+        # independently), built in one step rather than copy-then-update.
+        base_metadata = document.metadata
+        return [
+            Chunk(
+                content=piece,
+                document_id=document.id,
+                index=i,
+                parent_chunk_id=parent_chunk_id,
+                offsets=offsets[i] if offsets is not None else None,
+                metadata=(
+                    {**base_metadata, **extra_metadata[i]}
+                    if extra_metadata is not None
+                    else base_metadata.copy()
+                ),
             )
-        return chunks
+            for i, piece in enumerate(pieces)
+        ]
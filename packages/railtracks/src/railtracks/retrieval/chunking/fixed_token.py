@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+
 from ..models import Chunk, Document
 from .base import Chunker
 from .tokenization import TiktokenTokenizer, Tokenizer
@@ -14,6 +16,11 @@ class FixedTokenChunker(Chunker):
     sliced into windows of ``chunk_size`` tokens with ``overlap`` tokens
     of backward overlap between adjacent windows.
 
+    Long sources that are naturally produced in pieces (PDF pages, log
+    segments) can go through :meth:`chunk_segments` instead, which feeds
+    each piece into a rolling token buffer and never holds the joined text
+    or its full token list in memory.
+
     Offset tracking
     ---------------
     Token-based chunkers cannot cheaply recover character offsets from
@@ -46,22 +53,53 @@ def __init__(
         self.tokenizer: Tokenizer = tokenizer or TiktokenTokenizer()
 
     def chunk(self, document: Document) -> list[Chunk]:
-        text = document.content
-        if not text:
+        if not document.content:
             return []
+        return self._make_chunks(document, list(self._windows([document.content])))
 
-        tokens = self.tokenizer.encode(text)
-        if not tokens:
-            return []
+    def chunk_segments(
+        self, document: Document, segments: Iterable[str]
+    ) -> list[Chunk]:
+        """Chunk a document whose text arrives as consecutive segments.
+
+        Each segment is tokenized on its own and appended to a rolling
+        token buffer; windows are decoded as soon as they are full and the
+        consumed tokens are dropped. Peak memory is bounded by the largest
+        segment rather than the whole document. Windows may span segment
+        boundaries; segments are concatenated as given, so include any
+        separator (e.g. ``\\n\\n``) in the segments themselves.
+
+        Args:
+            document: Supplies ``id`` and ``metadata`` for the produced
+                chunks. Its ``content`` is not read.
+            segments: Ordered text pieces, e.g. a lazy generator of
+                extracted PDF pages.
+        """
+        return self._make_chunks(document, list(self._windows(segments)))
 
+    def _windows(self, segments: Iterable[str]) -> Iterator[str]:
         step = self.chunk_size - self.overlap
-        pieces: list[str] = []
+        buffer: list[int] = []
+        # Windows advance ``start`` rather than deleting from the front of
+        # ``buffer`` each time, which would make one long segment quadratic.
         start = 0
-        while start < len(tokens):
-            end = min(start + self.chunk_size, len(tokens))
-            pieces.append(self.tokenizer.decode(tokens[start:end]))
-            if end == len(tokens):
-                break
-            start += step
-
-        return self._make_chunks(document, pieces)
+        # Tokens at the tail of ``buffer`` not yet covered by any window.
+        pending = 0
+        for segment in segments:
+            if not segment:
+                continue
+            tokens = self.tokenizer.encode(segment)
+            buffer.extend(tokens)
+            pending += len(tokens)
+            while len(buffer) - start >= self.chunk_size:
+                end = start + self.chunk_size
+                yield self.tokenizer.decode(buffer[start:end])
+                pending = len(buffer) - end
+                start += step
+            # Drop the consumed prefix once it is most of the buffer, so
+            # trimming stays amortized O(1) per token.
+            if start > len(buffer) // 2:
+                del buffer[:start]
+                start = 0
+        if pending:
+            yield self.tokenizer.decode(buffer[start:])
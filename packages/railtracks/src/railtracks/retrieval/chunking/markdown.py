@@ -112,7 +112,7 @@ def chunk(self, document: Document) -> list[Chunk]:
             ):
                 pieces.append(body)
                 offsets.append((body_start, body_end))
-                extra_metadata.append(dict(meta_base))
+                extra_metadata.append(meta_base)
                 continue
 
             # Delegate oversized bodies to the fallback splitter.
@@ -120,7 +120,7 @@ def chunk(self, document: Document) -> list[Chunk]:
             for sub, s, e in sub_pieces_with_offsets:
                 pieces.append(sub)
                 offsets.append((s, e))
-                extra_metadata.append(dict(meta_base))
+                extra_metadata.append(meta_base)
 
         return self._make_chunks(
             document, pieces, offsets=offsets, extra_metadata=extra_metadata
@@ -143,6 +143,9 @@ def _split_into_sections(self, text: str) -> list[dict]:
               of ``body`` into ``text``.
         """
         header_re = re.compile(r"^(#{1,%d})\s+(.*)$" % self.max_header_level)
+        # Heading levels that split, hashed once per document rather than
+        # rebuilding "#" * level and scanning the specifier list per heading.
+        split_levels = frozenset(len(h) for h in self.headers_to_split_on)
 
         # First sweep: identify header lines and their absolute offsets.
         # We need absolute offsets, so walk the text manually.
@@ -191,7 +194,7 @@ def flush(body_end: int) -> None:
 
         for line_text, line_start, line_end in line_entries:
             m = header_re.match(line_text)
-            if m and ("#" * len(m.group(1))) in self.headers_to_split_on:
+            if m and len(m.group(1)) in split_levels:
                 flush(line_start)
                 level = len(m.group(1))
                 # Pop headings at equal or deeper level.
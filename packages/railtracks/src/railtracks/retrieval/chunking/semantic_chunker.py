@@ -304,9 +304,8 @@ def _add_context(self, sentences: list[str], window_size: int) -> list[str]:
             ``sentences[max(0, i - window_size) : min(n, i + window_size + 1)]``
             with spaces.
         """
-        contextualized: list[str] = []
-        for i in range(len(sentences)):
-            start = max(0, i - window_size)
-            end = min(len(sentences), i + window_size + 1)
-            contextualized.append(" ".join(sentences[start:end]))
-        return contextualized
+        # Slicing clamps the upper bound, so only the lower one needs max().
+        return [
+            " ".join(sentences[max(0, i - window_size) : i + window_size + 1])
+            for i in range(len(sentences))
+        ]
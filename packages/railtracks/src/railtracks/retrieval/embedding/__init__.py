@@ -1,4 +1,5 @@
 from .base import Embedding, SyncEmbedding
+from .cached import CachedEmbedding
 from .litellm import (
     AzureEmbedding,
     LiteLLMEmbedding,
@@ -15,6 +16,7 @@
 __all__ = [
     "Embedding",
     "SyncEmbedding",
+    "CachedEmbedding",
     "EmbeddingMetrics",
     "EmbeddingResult",
     "TextEmbeddings",
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+
+from .base import Embedding
+from .models import EmbeddingMetrics, TextEmbeddings
+
+
+def _cache_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class CachedEmbedding(Embedding):
+    """LRU cache in front of another ``Embedding``, keyed by text content.
+
+    Texts already seen are served from memory and only the misses reach the
+    wrapped embedder, so re-ingesting unchanged content or repeating a query
+    costs no provider call. Repeats inside a single call are embedded once.
+
+    Vectors are only ever reused for the model that produced them: when the
+    wrapped embedder reports a different model the cache is dropped, and a
+    call that had already been partly served from it is re-embedded in full.
+
+    Args:
+        embedding: The embedder to delegate cache misses to.
+        max_size: Maximum number of distinct texts kept; the least recently
+            used entry is evicted first. Defaults to 10,000.
+    """
+
+    def __init__(self, embedding: Embedding, max_size: int = 10_000) -> None:
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}")
+        self._embedding = embedding
+        self._max_size = max_size
+        self._cache: OrderedDict[bytes, list[float]] = OrderedDict()
+        self._model: str | None = None
+        self.default_batch_size = embedding.default_batch_size
+
+    async def aembed(self, texts: list[str]) -> TextEmbeddings:
+        cache = self._cache
+        vectors: list[list[float] | None] = [None] * len(texts)
+        misses: dict[bytes, list[int]] = {}
+        for i, text in enumerate(texts):
+            key = _cache_key(text)
+            vector = cache.get(key)
+            if vector is None:
+                misses.setdefault(key, []).append(i)
+            else:
+                cache.move_to_end(key)
+                # A copy, so a caller mutating its result cannot corrupt the cache.
+                vectors[i] = vector[:]
+
+        if not misses:
+            return TextEmbeddings(
+                vectors=vectors,
+                metrics=EmbeddingMetrics(
+                    vector_count=len(texts),
+                    model=self._model,
+                    dimension=len(vectors[0]) if vectors else None,
+                ),
+            )
+
+        result = await self._embedding.aembed(
+            [texts[idx[0]] for idx in misses.values()]
+        )
+        if len(result.vectors) != len(misses):
+            raise ValueError(
+                f"Provider returned {len(result.vectors)} vectors for {len(misses)} inputs"
+            )
+
+        served_from_cache = len(texts) > sum(len(idx) for idx in misses.values())
+        model_changed = result.metrics.model != self._model
+        if model_changed:
+            cache.clear()
+            self._model = result.metrics.model
+
+        for (key, indices), vector in zip(misses.items(), result.vectors):
+            cache[key] = vector
+            for i in indices:
+                vectors[i] = vector[:]
+        while len(cache) > self._max_size:
+            cache.popitem(last=False)
+
+        if model_changed and served_from_cache:
+            # The hits came from the previous model. Rare enough that simply
+            # re-embedding the whole call keeps the result single-model.
+            return await self._embedding.aembed(texts)
+
+        metrics = result.metrics
+        return TextEmbeddings(
+            vectors=vectors,
+            metrics=EmbeddingMetrics(
+                input_tokens=metrics.input_tokens,
+                total_cost=metrics.total_cost,
+                latency=metrics.latency,
+                vector_count=len(texts),
+                model=metrics.model,
+                dimension=metrics.dimension,
+            ),
+        )
@@ -14,6 +14,28 @@ def _get_vector(item: Any) -> list[float]:
     return item["embedding"] if isinstance(item, dict) else item.embedding
 
 
+def _get_vectors(data: list[Any]) -> list[list[float]]:
+    """Extract every vector from ``response.data``.
+
+    A single response is homogeneous (all dicts or all objects), so the
+    representation is decided once from the first item instead of per item.
+    """
+    if not data:
+        return []
+    if isinstance(data[0], dict):
+        return [_as_list(item["embedding"]) for item in data]
+    return [_as_list(item.embedding) for item in data]
+
+
+def _as_list(vector: Any) -> list[float]:
+    """Return ``vector`` as a list, copying only when it is not one already.
+
+    Providers almost always return plain lists; skipping the copy avoids
+    allocating a second list of boxed floats per vector.
+    """
+    return vector if type(vector) is list else list(vector)
+
+
 class LiteLLMEmbedding(Embedding):
     """Generic litellm-backed embedding provider.
 
@@ -58,7 +80,7 @@ async def aembed(self, texts: list[str]) -> TextEmbeddings:
             model=self._model, input=texts, **self._kwargs
         )
         latency = time.perf_counter() - t0
-        vectors = [list(_get_vector(item)) for item in response.data]
+        vectors = _get_vectors(response.data)
         return TextEmbeddings(
             vectors=vectors,
             metrics=self._extract_metrics(response, latency, len(vectors)),
@@ -2,11 +2,25 @@
 
 import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Collection
+from pathlib import Path
 
 from railtracks.retrieval.models import Document
 
 
+def _find_files(root: Path, suffixes: Collection[str]) -> list[Path]:
+    """Return every file under `root` whose lower-cased suffix is in `suffixes`.
+
+    Walks the tree once regardless of how many suffixes are accepted and
+    returns the matches in sorted order. Suffix matching is
+    case-insensitive, the same as the single-file checks in the loaders.
+    Blocking — loaders call it through ``asyncio.to_thread``.
+    """
+    return sorted(
+        p for p in root.rglob("*") if p.suffix.lower() in suffixes and p.is_file()
+    )
+
+
 class BaseDocumentLoader(ABC):
     """Abstract base class for all document loaders.
 
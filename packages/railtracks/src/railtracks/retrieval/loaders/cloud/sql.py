@@ -106,6 +106,11 @@ def __init__(
         self._table_or_query = table_or_query
         self._is_raw_query = _looks_like_query(table_or_query)
         self._keys = list(keys) if keys is not None else None
+        # Columns kept out of metadata when metadata_columns is not given,
+        # resolved once here instead of per row.
+        self._excluded_columns = frozenset(
+            col for col in (content_column, id_column) if col
+        )
 
         if self._keys is not None and id_column is None:
             raise ValueError("An 'id_column' must be set when filtering by 'keys'.")
@@ -161,9 +166,7 @@ def _row_to_document(self, row: dict[str, Any]) -> Document:
         if self._metadata_columns is not None:
             meta = {col: row[col] for col in self._metadata_columns if col in row}
         else:
-            excluded = {self._content_column}
-            if self._id_column:
-                excluded.add(self._id_column)
+            excluded = self._excluded_columns
             meta = {k: v for k, v in row.items() if k not in excluded}
 
         # Document.id is always an auto-generated UUID. The row's id_column
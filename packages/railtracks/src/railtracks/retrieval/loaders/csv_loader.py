@@ -5,7 +5,7 @@
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
-from railtracks.retrieval.loaders.base import BaseDocumentLoader
+from railtracks.retrieval.loaders.base import BaseDocumentLoader, _find_files
 from railtracks.retrieval.models import Document, DocumentType
 
 
@@ -14,6 +14,7 @@ class CSVLoader(BaseDocumentLoader):
 
     If `file_path` points to a directory, all `.csv` files are loaded
     recursively in sorted order. If it points to a file, that file is loaded.
+    Extensions match case-insensitively, so `.CSV` files are loaded too.
 
     Each row is converted to a `Document` and yielded as soon as it is read,
     without buffering the full file in memory.
@@ -109,18 +110,16 @@ def _iter_rows():
                         f"id_column not found in CSV headers: {self._id_column!r}"
                     )
 
-                content_col_set = set(content_columns)
+                # The metadata columns are the same for every row, so resolve
+                # them once rather than re-testing each column per row.
+                skipped = set(content_columns) | self._ignore_columns
+                metadata_columns = [col for col in fieldnames if col not in skipped]
 
                 for row_index, row in enumerate(reader):
                     content = self._content_separator.join(
                         f"{col}: {row[col]}" for col in content_columns
                     )
-                    metadata = {
-                        col: row[col]
-                        for col in fieldnames
-                        if col not in content_col_set
-                        and col not in self._ignore_columns
-                    }
+                    metadata = {col: row[col] for col in metadata_columns}
                     metadata["row_index"] = row_index
                     row_id = (
                         str(row[self._id_column])
@@ -153,10 +152,9 @@ async def astream(self) -> AsyncGenerator[Document, None]:
                 extension.
         """
         if self._path.is_dir():
-            for path in sorted(self._path.rglob("*.csv")):
-                if path.is_file():
-                    async for doc in self._stream_file(path):
-                        yield doc
+            for path in await asyncio.to_thread(_find_files, self._path, (".csv",)):
+                async for doc in self._stream_file(path):
+                    yield doc
             return
 
         if not self._path.is_file():
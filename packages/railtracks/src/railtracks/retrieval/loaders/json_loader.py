@@ -6,16 +6,19 @@
 from pathlib import Path
 from typing import Any, Literal
 
-from railtracks.retrieval.loaders.base import BaseDocumentLoader
+from railtracks.retrieval.loaders.base import BaseDocumentLoader, _find_files
 from railtracks.retrieval.models import Document, DocumentType
 
+_SUPPORTED_SUFFIXES = frozenset({".json", ".jsonl"})
+
 
 class JSONLoader(BaseDocumentLoader):
     """Loads JSON and JSON Lines files as `Document` objects.
 
     If `file_path` points to a directory, all `.json` and `.jsonl` files are
     loaded recursively in sorted order. If it points to a file, that file is
-    loaded; the format is selected by suffix.
+    loaded; the format is selected by suffix. Extensions match
+    case-insensitively, so `.JSON` files are loaded too.
 
     - `.json`: the file root must be a JSON object or an array of objects.
       For arrays, each element becomes a separate `Document`; for a single
@@ -72,6 +75,12 @@ def __init__(
         self._content_keys = content_keys
         self._id_key = id_key
         self._ignore_keys = set(ignore_keys or [])
+        # Keys kept out of metadata, hashed once instead of per object.
+        self._non_metadata_keys = (
+            frozenset(content_keys) | self._ignore_keys
+            if content_keys != "*"
+            else frozenset(self._ignore_keys)
+        )
         self._content_separator = content_separator
         self._encoding = encoding
 
@@ -113,12 +122,8 @@ def _object_to_document(
             content = self._content_separator.join(
                 f"{k}: {obj[k]}" for k in self._content_keys
             )
-            content_key_set = set(self._content_keys)
-            metadata = {
-                k: v
-                for k, v in obj.items()
-                if k not in content_key_set and k not in self._ignore_keys
-            }
+            excluded = self._non_metadata_keys
+            metadata = {k: v for k, v in obj.items() if k not in excluded}
 
         if self._id_key is not None and self._id_key not in obj:
             raise ValueError(
@@ -230,20 +235,16 @@ async def astream(self) -> AsyncGenerator[Document, None]:
                 extension.
         """
         if self._path.is_dir():
-            paths = sorted(
-                p
-                for pattern in ("*.json", "*.jsonl")
-                for p in self._path.rglob(pattern)
-                if p.is_file()
-            )
-            for path in paths:
+            for path in await asyncio.to_thread(
+                _find_files, self._path, _SUPPORTED_SUFFIXES
+            ):
                 async for doc in self._stream_file(path):
                     yield doc
             return
 
         if not self._path.is_file():
             raise FileNotFoundError(f"File not found: {self._path}")
-        if self._path.suffix.lower() not in (".json", ".jsonl"):
+        if self._path.suffix.lower() not in _SUPPORTED_SUFFIXES:
             raise ValueError(
                 f"JSONLoader expects a .json or .jsonl file, got {self._path.suffix!r}"
             )
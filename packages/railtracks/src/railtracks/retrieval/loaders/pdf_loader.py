@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import os
+import tempfile
 from collections.abc import AsyncGenerator
 from pathlib import Path
 from typing import Literal
 
-from railtracks.retrieval.loaders.base import BaseDocumentLoader
+from railtracks.retrieval.loaders.base import BaseDocumentLoader, _find_files
 from railtracks.retrieval.models import Document, DocumentType
+from railtracks.utils.logging.create import get_rt_logger
 
 try:
     from pypdf import PdfReader
@@ -17,14 +22,96 @@
     ) from exc
 
 
+logger = get_rt_logger(__name__)
+
 BreakdownStrategy = Literal["page", "document"]
 
+_CACHE_ENV_VAR = "RAILTRACKS_MEDIA_CACHE"
+
+_DEFAULT_CACHE_MAX_ENTRIES = 1000
+
+
+def _read_cached_pages(cache_file: Path) -> list[str] | None:
+    """Return the cached page texts, or ``None`` if absent or unreadable.
+
+    A hit refreshes the entry's modification time, which eviction treats as
+    its last use.
+    """
+    try:
+        pages = json.loads(cache_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(pages, list):
+        return None
+    try:
+        os.utime(cache_file)
+    except OSError:
+        pass
+    return pages
+
+
+def _evict_least_recently_used(cache_dir: Path, max_entries: int) -> None:
+    """Delete the least recently used entries beyond ``max_entries``.
+
+    Best-effort: an entry that vanishes or cannot be removed (e.g. a
+    concurrent load evicting the same file) is skipped.
+    """
+    entries: list[tuple[float, Path]] = []
+    for entry in cache_dir.glob("*.json"):
+        try:
+            entries.append((entry.stat().st_mtime, entry))
+        except OSError:
+            continue
+    if len(entries) <= max_entries:
+        return
+    entries.sort()
+    for _, entry in entries[: len(entries) - max_entries]:
+        try:
+            entry.unlink()
+        except OSError:
+            continue
+
+
+def _extract_all_pages(path: Path) -> list[str]:
+    """Parse a PDF and extract every page's text. Synchronous — run in a thread."""
+    return [page.extract_text() or "" for page in PdfReader(str(path)).pages]
+
+
+def _write_cached_pages(cache_file: Path, pages: list[str], max_entries: int) -> None:
+    """Atomically write page texts so concurrent readers never see partial files.
+
+    Best-effort, like the read: a cache directory that cannot be written is
+    logged and skipped rather than failing a load whose text is already
+    extracted. Each write goes through its own temp file, so concurrent loads
+    of the same PDF never share one. After the write, the directory is
+    trimmed back to ``max_entries`` by dropping the least recently used.
+    """
+    tmp_name: str | None = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_file.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as tmp:
+            tmp_name = tmp.name
+            tmp.write(json.dumps(pages))
+        os.replace(tmp_name, cache_file)
+        _evict_least_recently_used(cache_file.parent, max_entries)
+    except OSError as exc:
+        logger.warning("Could not write PDF page cache %s: %s", cache_file, exc)
+        if tmp_name is not None:
+            Path(tmp_name).unlink(missing_ok=True)
+
 
 class PyPDFLoader(BaseDocumentLoader):
     """Loads PDF files as `Document` objects.
 
     If `file_path` points to a directory, all `.pdf` files are loaded
     recursively in sorted order. If it points to a file, that file is loaded.
+    Extensions match case-insensitively, so `.PDF` files are loaded too.
 
     Breakdown strategies:
 
@@ -34,30 +121,127 @@ class PyPDFLoader(BaseDocumentLoader):
     - `document`: entire PDF as one `Document`, with pages joined by ``\\n\\n``.
       `metadata` includes `total_pages` and `file_type`.
 
+    Extracted page text can optionally be cached on disk, keyed by the file's
+    path, modification time and size. Re-loading an unchanged PDF then reads
+    the cached text instead of re-parsing it. The cache holds at most
+    `cache_max_entries` files; each write evicts the least recently used
+    beyond that. The cache directory is safe to delete at any time.
+
     Requires: ``pip install "railtracks[pdf]"``
 
     Args:
         file_path: Path to a `.pdf` file or a directory containing `.pdf` files.
         breakdown_strategy: How to split each PDF into `Document` objects.
             Defaults to `page`.
+        cache_dir: Directory for cached page text. Defaults to the
+            ``RAILTRACKS_MEDIA_CACHE`` environment variable; caching is
+            disabled when neither is set.
+        cache_max_entries: Maximum number of PDFs kept in the cache.
+            Defaults to 1000.
 
     Raises:
         FileNotFoundError: If `file_path` does not exist.
-        ValueError: If `breakdown_strategy` is not `page` or `document`, or if
-            `file_path` points to a file with an unsupported extension.
+        ValueError: If `breakdown_strategy` is not `page` or `document`, if
+            `cache_max_entries` is less than 1, or if `file_path` points to a
+            file with an unsupported extension.
     """
 
     def __init__(
         self,
         file_path: str,
         breakdown_strategy: BreakdownStrategy = "page",
+        cache_dir: str | None = None,
+        cache_max_entries: int = _DEFAULT_CACHE_MAX_ENTRIES,
     ) -> None:
         self._path = Path(file_path)
         if breakdown_strategy not in ("page", "document"):
             raise ValueError(
                 f"breakdown_strategy must be 'page' or 'document', got {breakdown_strategy!r}"
             )
+        if cache_max_entries < 1:
+            raise ValueError(
+                f"cache_max_entries must be at least 1, got {cache_max_entries}"
+            )
+        self._cache_max_entries = cache_max_entries
         self._breakdown_strategy = breakdown_strategy
+        cache_dir = cache_dir or os.environ.get(_CACHE_ENV_VAR)
+        self._cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+
+    def _cache_file(self, path: Path) -> Path | None:
+        """Return the cache entry for `path`, or ``None`` if caching is off."""
+        if self._cache_dir is None:
+            return None
+        st = path.stat()
+        key = hashlib.blake2b(
+            f"{path.resolve()}|{st.st_mtime_ns}|{st.st_size}".encode(),
+            digest_size=16,
+        ).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+    def _lookup_cache(self, path: Path) -> tuple[Path | None, list[str] | None]:
+        """Return ``(cache_file, cached_pages)`` for `path`.
+
+        Synchronous — stats the PDF and reads the entry, so run it in a thread.
+        """
+        cache_file = self._cache_file(path)
+        if cache_file is None:
+            return None, None
+        return cache_file, _read_cached_pages(cache_file)
+
+    async def _page_texts(self, path: Path) -> AsyncGenerator[tuple[str, int], None]:
+        """Yield ``(text, total_pages)`` for each page of a PDF in order.
+
+        Pages are served from the cache when an entry exists. Otherwise the
+        PDF is parsed page by page and, once every page has been read, the
+        texts are written to the cache.
+
+        Args:
+            path: Path to the PDF file to read.
+
+        Yields:
+            tuple[str, int]: The page text (``""`` for pages without text)
+            and the total page count.
+        """
+        cache_file, cached = None, None
+        if self._cache_dir is not None:
+            cache_file, cached = await asyncio.to_thread(self._lookup_cache, path)
+        if cached is not None:
+            for text in cached:
+                yield text, len(cached)
+            return
+
+        reader = await asyncio.to_thread(PdfReader, str(path))
+        total_pages = len(reader.pages)
+        texts: list[str] = []
+        for page in reader.pages:
+            text = await asyncio.to_thread(page.extract_text) or ""
+            texts.append(text)
+            yield text, total_pages
+
+        if cache_file is not None:
+            await asyncio.to_thread(
+                _write_cached_pages, cache_file, texts, self._cache_max_entries
+            )
+
+    async def _all_page_texts(self, path: Path) -> list[str]:
+        """Return every page's text, from the cache or one parse in a thread.
+
+        Unlike :meth:`_page_texts` nothing is consumed page by page, so the
+        whole extraction runs in a single worker-thread hop instead of one
+        per page.
+        """
+        cache_file, cached = None, None
+        if self._cache_dir is not None:
+            cache_file, cached = await asyncio.to_thread(self._lookup_cache, path)
+        if cached is not None:
+            return cached
+
+        texts = await asyncio.to_thread(_extract_all_pages, path)
+        if cache_file is not None:
+            await asyncio.to_thread(
+                _write_cached_pages, cache_file, texts, self._cache_max_entries
+            )
+        return texts
 
     async def _stream_file(self, path: Path) -> AsyncGenerator[Document, None]:
         """Stream documents from a single PDF file.
@@ -71,23 +255,22 @@ async def _stream_file(self, path: Path) -> AsyncGenerator[Document, None]:
         Yields:
             Document: The next extracted document.
         """
-        reader = await asyncio.to_thread(PdfReader, str(path))
-        total_pages = len(reader.pages)
         source = str(path)
 
         if self._breakdown_strategy == "document":
-            content = "\n\n".join(page.extract_text() or "" for page in reader.pages)
+            texts = await self._all_page_texts(path)
             yield Document(
-                content=content,
+                content="\n\n".join(texts),
                 type=DocumentType.PDF,
                 source=source,
-                metadata={"total_pages": total_pages, "file_type": ".pdf"},
+                metadata={"total_pages": len(texts), "file_type": ".pdf"},
             )
             return
 
-        for page_number, page in enumerate(reader.pages, start=1):
-            text = await asyncio.to_thread(page.extract_text)
-            if not text or not text.strip():
+        page_number = 0
+        async for text, total_pages in self._page_texts(path):
+            page_number += 1
+            if not text.strip():
                 continue
             yield Document(
                 content=text,
@@ -120,10 +303,9 @@ async def astream(self) -> AsyncGenerator[Document, None]:
                 extension.
         """
         if self._path.is_dir():
-            for path in sorted(self._path.rglob("*.pdf")):
-                if path.is_file():
-                    async for doc in self._stream_file(path):
-                        yield doc
+            for path in await asyncio.to_thread(_find_files, self._path, (".pdf",)):
+                async for doc in self._stream_file(path):
+                    yield doc
             return
 
         if not self._path.is_file():
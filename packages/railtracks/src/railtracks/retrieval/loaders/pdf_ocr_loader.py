@@ -5,6 +5,7 @@
 from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 
+from railtracks.retrieval.loaders.base import _find_files
 from railtracks.retrieval.loaders.base_ocr import BaseOCRLoader
 from railtracks.retrieval.models import Document, DocumentType
 
@@ -51,6 +52,7 @@ class PyPDFOCRLoader(BaseOCRLoader):
 
     If `file_path` points to a directory, all `.pdf` files are loaded
     recursively in sorted order. If it points to a file, that file is loaded.
+    Extensions match case-insensitively, so `.PDF` files are loaded too.
 
     Breakdown strategies:
 
@@ -228,10 +230,9 @@ async def astream(self) -> AsyncGenerator[Document, None]:
                 extension.
         """
         if self._path.is_dir():
-            for path in sorted(self._path.rglob("*.pdf")):
-                if path.is_file():
-                    async for doc in self._stream_file(path):
-                        yield doc
+            for path in await asyncio.to_thread(_find_files, self._path, (".pdf",)):
+                async for doc in self._stream_file(path):
+                    yield doc
             return
 
         if not self._path.is_file():
@@ -4,10 +4,14 @@
 from collections.abc import AsyncGenerator
 from pathlib import Path
 
-from railtracks.retrieval.loaders.base import BaseDocumentLoader
+from railtracks.retrieval.loaders.base import BaseDocumentLoader, _find_files
 from railtracks.retrieval.models import Document, DocumentType
 
-_SUPPORTED_EXTENSIONS = {".txt", ".md"}
+# Extension -> DocumentType dispatch table; its keys are the supported set.
+_EXTENSION_TO_TYPE: dict[str, DocumentType] = {
+    ".txt": DocumentType.TEXT,
+    ".md": DocumentType.MARKDOWN,
+}
 
 
 class TextLoader(BaseDocumentLoader):
@@ -15,7 +19,7 @@ class TextLoader(BaseDocumentLoader):
 
     If `file_path` points to a directory, all `.txt` and `.md` files
     are loaded recursively in sorted order. If it points to a file,
-    that file is loaded.
+    that file is loaded. Extensions match case-insensitively.
 
     Each file is read and yielded individually as soon as it is ready,
     allowing downstream stages to begin processing without waiting for
@@ -46,15 +50,13 @@ def _load_file(self, path: Path) -> Document:
             Document: The loaded document.
         """
         content = path.read_text(encoding=self._encoding)
-        doc_type = (
-            DocumentType.MARKDOWN if path.suffix.lower() == ".md" else DocumentType.TEXT
-        )
+        suffix = path.suffix.lower()
         return Document(
             content=content,
-            type=doc_type,
+            type=_EXTENSION_TO_TYPE[suffix],
             source=str(path),
             metadata={
-                "file_type": path.suffix.lower(),
+                "file_type": suffix,
                 "encoding": self._encoding,
             },
         )
@@ -75,19 +77,16 @@ async def astream(self) -> AsyncGenerator[Document, None]:
                 extension.
         """
         if self._path.is_dir():
-            paths = sorted(
-                p
-                for p in self._path.rglob("*")
-                if p.suffix.lower() in _SUPPORTED_EXTENSIONS and p.is_file()
-            )
-            for path in paths:
+            for path in await asyncio.to_thread(
+                _find_files, self._path, _EXTENSION_TO_TYPE
+            ):
                 yield await asyncio.to_thread(self._load_file, path)
             return
 
-        if self._path.suffix.lower() not in _SUPPORTED_EXTENSIONS:
+        if self._path.suffix.lower() not in _EXTENSION_TO_TYPE:
             raise ValueError(
                 f"Unsupported file extension: {self._path.suffix!r}. "
-                f"Supported extensions: {_SUPPORTED_EXTENSIONS}"
+                f"Supported extensions: {set(_EXTENSION_TO_TYPE)}"
             )
         if not self._path.is_file():
             raise FileNotFoundError(f"File not found: {self._path}")
@@ -70,7 +70,9 @@ def __post_init__(self) -> None:
             )
 
 
-@dataclass
+# Chunk-level models are slotted: ingestion and retrieval create one per
+# chunk or hit, so dropping the per-instance __dict__ adds up.
+@dataclass(slots=True)
 class Chunk:
     content: str
     document_id: UUID
@@ -81,7 +83,7 @@ class Chunk:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddedChunk:
     chunk: Chunk
     vector: list[float]
@@ -89,7 +91,7 @@ class EmbeddedChunk:
     embedding_version: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RetrievedChunk:
     chunk: Chunk
     score: float
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
-from collections.abc import AsyncGenerator
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Sequence
 from dataclasses import dataclass, field
 from typing import Any, Callable
 from uuid import UUID
@@ -17,6 +19,7 @@
 from .models import Chunk, Document, EmbeddedChunk, RetrievalResult, RetrievedChunk
 from .stores.models import StoreEntry, StoreQuery, StoreScope
 from .stores.protocol import Store
+from .utils import aprefetch
 
 logger = get_rt_logger(__name__)
 
@@ -130,6 +133,9 @@ class RetrievalRuntime:
             Requires ``tokenizer`` (defaults to ``TiktokenTokenizer``).
         tokenizer: Tokenizer used to enforce ``max_tokens``. Defaults to
             ``TiktokenTokenizer`` lazily when ``max_tokens`` is set.
+        query_cache_size: Number of query embeddings to keep in an LRU
+            cache so repeated :meth:`retrieve` / :meth:`retrieve_many`
+            queries skip the embedder. Defaults to 0 (no caching).
     """
 
     def __init__(
@@ -146,6 +152,7 @@ def __init__(
         on_retrieve: Callable[[str, RetrievalResult], None] | None = None,
         max_tokens: int | None = None,
         tokenizer: Tokenizer | None = None,
+        query_cache_size: int = 0,
     ) -> None:
         self._chunker = chunker
         self._embedder = embedder
@@ -159,6 +166,11 @@ def __init__(
 
             tokenizer = TiktokenTokenizer()
         self._tokenizer = tokenizer
+        # query text -> (vector, embedding model that produced it)
+        self._query_cache_size = query_cache_size
+        self._query_cache: OrderedDict[str, tuple[list[float], str | None]] | None = (
+            OrderedDict() if query_cache_size > 0 else None
+        )
         # Captured on the first successful embedded batch and checked at
         # retrieve time; survives process restarts by lazy-seeding from
         # an existing store entry on the first ingest/retrieve.
@@ -375,8 +387,10 @@ async def _embed_and_store(
         # failed) within this document and resets for the next one.
         batch_index = 0
         delete_done = False
-        async for batch in self._embedder.astream_batches(
-            chunks, batch_size=self._batch_size
+        # Prefetching lets the embedder work on the next batch while the
+        # current one is being written to the store.
+        async for batch in aprefetch(
+            self._embedder.astream_batches(chunks, batch_size=self._batch_size)
         ):
             if isinstance(batch, EmbeddingResult):
                 # Check model BEFORE delete_where / write — a mismatch here
@@ -385,10 +399,11 @@ async def _embed_and_store(
                 if not delete_done:
                     await self._store.delete_where({"document_id": str(doc.id)})
                     delete_done = True
+                entries: list[StoreEntry] = []
                 for embedded in batch.chunks:
                     self._capture_model(embedded)
-                    entry = StoreEntry.from_chunk(embedded, scope=scope)
-                    await self._store.write(entry)
+                    entries.append(StoreEntry.from_chunk(embedded, scope=scope))
+                await self._write_entries(entries)
                 stats.chunks_embedded += len(batch.chunks)
                 stats.total_metrics = stats.total_metrics + batch.metrics
                 yield BatchIngested(
@@ -404,6 +419,18 @@ async def _embed_and_store(
                 yield batch
             batch_index += 1
 
+    async def _write_entries(self, entries: list[StoreEntry]) -> None:
+        """Write a batch of entries in one store call when the store supports
+        ``write_many`` (``VectorStore`` does); otherwise write them one by one.
+        ``write_many`` is not part of the ``Store`` protocol so custom stores
+        keep working unchanged."""
+        write_many = getattr(self._store, "write_many", None)
+        if write_many is not None:
+            await write_many(entries)
+            return
+        for entry in entries:
+            await self._store.write(entry)
+
     def _capture_model(self, embedded: EmbeddedChunk) -> None:
         """Record the embedding model from the first successful chunk so later
         retrieve() calls can enforce model consistency."""
@@ -462,6 +489,44 @@ def _record_document_failed(
         stats.failed_documents.append(failed)
         return failed
 
+    async def write_embedded(
+        self,
+        embedded_chunks: Sequence[EmbeddedChunk],
+        *,
+        scope: StoreScope | None = None,
+    ) -> None:
+        """Write chunks whose vectors were computed upstream, skipping the embedder.
+
+        The same model guard as :meth:`ingest` applies: every chunk's
+        ``embedding_model`` must match the model this store was built with.
+        Unlike :meth:`ingest`, prior chunks of the same document are not
+        cleared — call :meth:`delete_document` first to replace a document.
+
+        Raises:
+            EmbeddingModelMismatchError: When a chunk was embedded with a
+                model different from the captured one, or the chunks mix
+                models. Nothing is written and no model is captured.
+        """
+        if not embedded_chunks:
+            return
+        await self._ensure_captured_model_seeded()
+        # Validate the whole batch before capturing anything, so a rejected
+        # batch cannot leave a model captured that never reached the store.
+        models = {e.embedding_model for e in embedded_chunks if e.embedding_model}
+        for model in models:
+            self._check_model(model)
+        if len(models) > 1:
+            raise EmbeddingModelMismatchError(
+                f"Chunks were embedded with several models {sorted(models)!r}. "
+                "Similarity scores across models are meaningless; write one "
+                "model's chunks per store."
+            )
+        for embedded in embedded_chunks:
+            self._capture_model(embedded)
+        await self._write_entries(
+            [StoreEntry.from_chunk(e, scope=scope) for e in embedded_chunks]
+        )
+
     async def delete_document(self, document_id: UUID) -> None:
         """Remove all chunks for a document from the store.
 
@@ -491,13 +556,106 @@ async def retrieve(
                 different from the one captured on first ingest.
         """
         await self._ensure_captured_model_seeded()
-        text_result = await self._embedder.aembed([query])
-        self._check_model(text_result.metrics.model)
+        vectors = await self._embed_queries([query])
+        return await self._search(query, vectors[0], top_k, metadata_filters, scope)
+
+    async def retrieve_many(
+        self,
+        queries: Sequence[str],
+        top_k: int = 5,
+        metadata_filters: dict[str, Any] | None = None,
+        scope: StoreScope | None = None,
+        *,
+        dedupe: bool = True,
+    ) -> list[RetrievalResult]:
+        """Retrieve for several queries at once.
+
+        All queries are embedded in a single embedder call and the store
+        searches run concurrently, so latency is close to that of one
+        :meth:`retrieve` rather than growing with the number of queries.
+        Arguments apply to every query; see :meth:`retrieve`.
+
+        Args:
+            dedupe: Embed and search each distinct query text only once.
+                Repeated queries then share one ``RetrievalResult`` object
+                and ``on_retrieve`` fires once per distinct text. Pass
+                ``False`` to run every occurrence independently.
+
+        Returns:
+            One ``RetrievalResult`` per query, in input order.
+
+        Raises:
+            EmbeddingModelMismatchError: When the embedder reports a model
+                different from the one captured on first ingest.
+        """
+        if not queries:
+            return []
+        if dedupe:
+            positions: dict[str, int] = {}
+            inverse = [positions.setdefault(q, len(positions)) for q in queries]
+            if len(positions) < len(inverse):
+                unique = await self.retrieve_many(
+                    list(positions), top_k, metadata_filters, scope, dedupe=False
+                )
+                return [unique[i] for i in inverse]
+        await self._ensure_captured_model_seeded()
+        # Embedders take a list; avoid copying one the caller already built.
+        texts = queries if type(queries) is list else list(queries)
+        vectors = await self._embed_queries(texts)
+        # gather already returns a fresh list in input order.
+        return await asyncio.gather(
+            *(
+                self._search(query, vector, top_k, metadata_filters, scope)
+                for query, vector in zip(queries, vectors)
+            )
+        )
+
+    async def _embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """Embed query texts in one embedder call, serving cached ones first.
 
+        Raises ``EmbeddingModelMismatchError`` for fresh and cached vectors
+        alike, so enabling the cache never weakens the model guard.
+        """
+        cache = self._query_cache
+        if cache is None:
+            text_result = await self._embedder.aembed(queries)
+            self._check_model(text_result.metrics.model)
+            return text_result.vectors
+
+        found: dict[str, list[float]] = {}
+        for query in queries:
+            cached = cache.get(query)
+            if cached is not None:
+                cache.move_to_end(query)
+                vector, model = cached
+                self._check_model(model)
+                found[query] = vector
+
+        misses = [q for q in dict.fromkeys(queries) if q not in found]
+        if misses:
+            text_result = await self._embedder.aembed(misses)
+            model = text_result.metrics.model
+            self._check_model(model)
+            for query, vector in zip(misses, text_result.vectors):
+                found[query] = vector
+                cache[query] = (vector, model)
+            while len(cache) > self._query_cache_size:
+                cache.popitem(last=False)
+
+        return [found[q] for q in queries]
+
+    async def _search(
+        self,
+        query: str,
+        embedding: list[float],
+        top_k: int,
+        metadata_filters: dict[str, Any] | None,
+        scope: StoreScope | None,
+    ) -> RetrievalResult:
         store_query = StoreQuery(
             text=query,
             scope=scope,
-            embedding=text_result.vectors[0],
+            embedding=embedding,
             top_k=top_k,
             metadata_filters=metadata_filters,
         )
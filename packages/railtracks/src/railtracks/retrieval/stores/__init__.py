@@ -1,3 +1,6 @@
+import importlib
+from typing import TYPE_CHECKING
+
 from .key_value import (
     InMemoryKeyValueStore,
     KeyValueStore,
@@ -11,13 +14,15 @@
 )
 from .protocol import Store
 from .vector import VectorStore
-from .vector.backends import (
-    ChromaBackend,
-    ChromaCloudBackend,
-    DistanceMetric,
-    PgvectorBackend,
-)
-from .vector.backends import InMemoryBackend as InMemoryVectorBackend
+from .vector.backends import DistanceMetric
+
+if TYPE_CHECKING:
+    from .vector.backends import (
+        ChromaBackend,
+        ChromaCloudBackend,
+        PgvectorBackend,
+    )
+    from .vector.backends import InMemoryBackend as InMemoryVectorBackend
 
 __all__ = [
     "ChromaBackend",
@@ -35,3 +40,22 @@
     "StoreScope",
     "VectorStore",
 ]
+
+# Backend classes are resolved lazily through ``vector.backends`` so importing
+# the stores package does not load numpy; ``InMemoryVectorBackend`` is an alias.
+_LAZY_BACKENDS = {
+    "ChromaBackend": "ChromaBackend",
+    "ChromaCloudBackend": "ChromaCloudBackend",
+    "InMemoryVectorBackend": "InMemoryBackend",
+    "PgvectorBackend": "PgvectorBackend",
+}
+
+
+def __getattr__(name: str):
+    backend_name = _LAZY_BACKENDS.get(name)
+    if backend_name is not None:
+        backends = importlib.import_module(f"{__name__}.vector.backends")
+        value = getattr(backends, backend_name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
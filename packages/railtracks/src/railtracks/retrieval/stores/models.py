@@ -8,6 +8,9 @@
 
 from ..models import EmbeddedChunk
 
+# Prepended to every scope label in payloads; see StoreScope.to_payload_filters.
+_SCOPE_PREFIX = "scope_"
+
 
 @dataclass(frozen=True)
 class Entity:
@@ -37,10 +40,10 @@ class StoreScope:
     labels: Mapping[str, Any] = field(default_factory=dict)
 
     def to_payload_filters(self) -> dict[str, Any]:
-        return {f"scope_{k}": v for k, v in self.labels.items()}
+        return {f"{_SCOPE_PREFIX}{k}": v for k, v in self.labels.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class StoreEntry:
     # Required fields
     id: UUID
@@ -100,7 +103,9 @@ def from_chunk(
         )
 
 
-@dataclass
+# Slotted: one of these is built per search hit, so the smaller, dict-free
+# instances add up on large top_k reads.
+@dataclass(slots=True)
 class RetrievedStoreEntry:
     entry: StoreEntry
     score: float
@@ -0,0 +1,18 @@
+"""Compact JSON encoding for vector-store payloads.
+
+Payload fields such as ``chunk_metadata`` and ``entities`` are serialized once
+per upserted entry, so every encode goes through this one helper with compact
+separators. It always uses the standard library encoder: ``orjson`` is not a
+declared dependency, and it accepts (and renders) a different set of values,
+so the stored payloads would otherwise depend on which extras are installed.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize ``obj`` to a compact JSON string."""
+    return json.dumps(obj, separators=(",", ":"))
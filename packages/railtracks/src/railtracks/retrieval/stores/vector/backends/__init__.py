@@ -1,7 +1,19 @@
+"""Vector backend implementations.
+
+Backends are imported on first access: they pull in numpy, which would
+otherwise dominate the import time of the retrieval package for callers that
+never touch a concrete backend.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
 from ..metric import DistanceMetric
-from .chroma import ChromaBackend, ChromaCloudBackend
-from .in_memory import InMemoryBackend
-from .pgvector import PgvectorBackend
+
+if TYPE_CHECKING:
+    from .chroma import ChromaBackend, ChromaCloudBackend
+    from .in_memory import InMemoryBackend
+    from .pgvector import PgvectorBackend
 
 __all__ = [
     "ChromaBackend",
@@ -10,3 +22,20 @@
     "InMemoryBackend",
     "PgvectorBackend",
 ]
+
+_LAZY_MODULES = {
+    "ChromaBackend": "chroma",
+    "ChromaCloudBackend": "chroma",
+    "InMemoryBackend": "in_memory",
+    "PgvectorBackend": "pgvector",
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_MODULES.get(name)
+    if module_name is not None:
+        module = importlib.import_module(f"{__name__}.{module_name}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,13 @@
 
 import asyncio
 import math
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import asynccontextmanager
 from typing import Any
 
+import numpy as np
 from typing_extensions import Self
 
 from ..metric import DistanceMetric
@@ -23,44 +28,121 @@ def _to_chroma_where(filters: dict) -> dict:
 _GET_PAGE_SIZE = 300
 
 
-def _get_paged(
+# Chroma Cloud caps the number of records in a single write the same way.
+# upsert_many splits larger batches at this size and sends the pieces
+# concurrently so their network round-trips overlap.
+_WRITE_BATCH_SIZE = 300
+
+
+def _upsert_batch(collection: Any, items: list[tuple[str, list[float], dict]]) -> None:
+    """Upsert one write-sized batch. Synchronous — run via ``asyncio.to_thread``.
+
+    Chroma takes one ``documents`` list for the whole request and rejects
+    ``None`` entries in it, so records without content go out in a second
+    request. Each record keeps its own document, as with single upserts.
+    """
+    with_content = [item for item in items if item[2].get("content") is not None]
+    without_content = [item for item in items if item[2].get("content") is None]
+    for group, has_content in ((with_content, True), (without_content, False)):
+        if not group:
+            continue
+        ids, embeddings, metadatas = (list(col) for col in zip(*group))
+        collection.upsert(
+            ids=ids,
+            # Chroma stores float32 and otherwise converts each list row on its
+            # own; one 2-D array moves the whole batch in a single C-level pass.
+            embeddings=np.asarray(embeddings, dtype=np.float32),
+            documents=(
+                [payload["content"] for payload in metadatas] if has_content else None
+            ),
+            metadatas=metadatas,
+        )
+
+
+def _iter_pages(
     collection: Any, where: dict | None, limit: int | None, include: list[str]
-) -> tuple[list, list]:
-    """Offset-paged ``collection.get`` capped at ``_GET_PAGE_SIZE`` per request.
+) -> Iterator[dict]:
+    """Yield raw ``collection.get`` results, each capped at ``_GET_PAGE_SIZE``.
 
     Synchronous — run via ``asyncio.to_thread``. ``limit=None`` reads to
-    exhaustion. Returns ``(ids, metadatas)``; ``metadatas`` is empty when not
-    requested via ``include``.
+    exhaustion. Only one page is held at a time, so callers that reduce
+    pages (e.g. counting) never buffer the full result.
     """
-    ids: list = []
-    metadatas: list = []
-    offset = 0
+    fetched = 0
     while True:
-        page = (
-            _GET_PAGE_SIZE if limit is None else min(_GET_PAGE_SIZE, limit - len(ids))
-        )
+        page = _GET_PAGE_SIZE if limit is None else min(_GET_PAGE_SIZE, limit - fetched)
         if page <= 0:
-            break
-        result = collection.get(where=where, limit=page, offset=offset, include=include)
-        ids.extend(result["ids"])
-        metadatas.extend(result.get("metadatas") or [])
+            return
+        result = collection.get(
+            where=where, limit=page, offset=fetched, include=include
+        )
+        yield result
         if len(result["ids"]) < page:
-            break
-        offset += len(result["ids"])
-    return ids, metadatas
+            return
+        fetched += len(result["ids"])
 
 
-def _chroma_to_score(metric: DistanceMetric, distance: float) -> float:
-    """Convert a raw Chroma distance to a similarity score (higher = better).
+def _list_paged(
+    collection: Any, where: dict | None, limit: int | None
+) -> list[tuple[str, dict]]:
+    """Offset-paged ``(id, metadata)`` listing capped at ``_GET_PAGE_SIZE`` per request.
 
-    Chroma (via hnswlib) distance conventions:
-        cosine  1 - cosine_similarity       → score = 1 - d
-        l2      squared L2 (||a-b||²)       → score = 1 / (1 + sqrt(d))
-        ip      1 - dot_product             → score = 1 - d  (= dot_product)
+    Synchronous — run via ``asyncio.to_thread``. ``limit=None`` reads to
+    exhaustion. Pairs are built as each page arrives, so only one raw page
+    is alive at a time rather than full parallel id and metadata lists.
     """
-    if metric is DistanceMetric.L2:
-        return 1.0 / (1.0 + math.sqrt(distance))
-    return 1.0 - distance  # COSINE and IP share the same formula
+    return [
+        (id_, metadata if metadata is not None else {})
+        for result in _iter_pages(collection, where, limit, ["metadatas"])
+        for id_, metadata in zip(result["ids"], result.get("metadatas") or [])
+    ]
+
+
+def _count_paged(collection: Any, where: dict | None) -> int:
+    """Count matches page by page without accumulating their ids."""
+    return sum(
+        len(result["ids"]) for result in _iter_pages(collection, where, None, [])
+    )
+
+
+# Remote clients (HttpClient / CloudClient) each hold their own HTTP
+# connection pool. Backends pointing at the same endpoint share one client so
+# that additional collections reuse its warm connections instead of paying a
+# fresh TLS handshake. Keyed by the client factory plus its connection
+# arguments; local Persistent/Ephemeral clients are not cached here.
+_SHARED_CLIENTS: dict[tuple, Any] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _shared_client(factory: Any, **kwargs: Any) -> Any:
+    """Return the client built by ``factory(**kwargs)``, creating it once.
+
+    Synchronous — run via ``asyncio.to_thread``.
+    """
+    key = (factory, *sorted(kwargs.items()))
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(key)
+        if client is None:
+            client = factory(**kwargs)
+            _SHARED_CLIENTS[key] = client
+        return client
+
+
+# Chroma (via hnswlib) distance conventions:
+#     cosine  1 - cosine_similarity       → score = 1 - d
+#     l2      squared L2 (||a-b||²)       → score = 1 / (1 + sqrt(d))
+#     ip      1 - dot_product             → score = 1 - d  (= dot_product)
+# Looked up once per search rather than re-dispatching on the metric per hit.
+_CHROMA_SCORE: dict[DistanceMetric, Callable[[float], float]] = {
+    DistanceMetric.COSINE: lambda d: 1.0 - d,
+    DistanceMetric.L2: lambda d: 1.0 / (1.0 + math.sqrt(d)),
+    DistanceMetric.IP: lambda d: 1.0 - d,
+}
+
+
+def _chroma_to_score(metric: DistanceMetric, distance: float) -> float:
+    """Convert a raw Chroma distance to a similarity score (higher = better)."""
+    return _CHROMA_SCORE[metric](distance)
 
 
 class _ChromaBase:
@@ -69,22 +151,88 @@ class _ChromaBase:
     _NOT_INITIALIZED: str = "Chroma backend is not initialized"
     _metric: DistanceMetric
     _collection: Any
+    _count_ttl: float = 0.0
+    _count_cache: tuple[float, int] | None = None
+    # Bumped when a write through this backend finishes; see _writing.
+    _write_generation: int = 0
+    _writes_in_flight: int = 0
 
     def _require_initialized(self) -> None:
         if self._collection is None:
             raise RuntimeError(self._NOT_INITIALIZED)
 
+    @asynccontextmanager
+    async def _writing(self) -> AsyncIterator[None]:
+        """Wrap a write so the cached count is dropped once it has landed.
+
+        Clearing only after the awaited write (even a failed one) means a
+        count read that overlapped it cannot be re-cached as current.
+        """
+        self._writes_in_flight += 1
+        try:
+            yield
+        finally:
+            self._writes_in_flight -= 1
+            self._write_generation += 1
+            self._count_cache = None
+
+    async def _total_count(self) -> int:
+        """Unfiltered collection size, served from cache within ``count_ttl``.
+
+        Writes and deletes through this backend drop the cached value, so
+        the TTL only bounds staleness from other writers to the collection.
+        A count read while one of this backend's writes is in flight is
+        returned but not cached.
+        """
+        if self._count_cache is not None:
+            cached_at, value = self._count_cache
+            if time.monotonic() - cached_at < self._count_ttl:
+                return value
+        generation = self._write_generation
+        value = await asyncio.to_thread(self._collection.count)
+        if (
+            self._count_ttl > 0
+            and not self._writes_in_flight
+            and generation == self._write_generation
+        ):
+            self._count_cache = (time.monotonic(), value)
+        return value
+
     async def upsert(self, id: str, vector: list[float], payload: dict) -> None:
         self._require_initialized()
         collection = self._collection
         content = payload.get("content")
-        await asyncio.to_thread(
-            collection.upsert,
-            ids=[id],
-            embeddings=[vector],
-            documents=[content] if content is not None else None,
-            metadatas=[payload],
-        )
+        async with self._writing():
+            await asyncio.to_thread(
+                collection.upsert,
+                ids=[id],
+                embeddings=[vector],
+                documents=[content] if content is not None else None,
+                metadatas=[payload],
+            )
+
+    async def upsert_many(self, items: list[tuple[str, list[float], dict]]) -> None:
+        self._require_initialized()
+        if not items:
+            return
+        if len(items) == 1:
+            # One record needs neither batch splitting nor a gather.
+            await self.upsert(*items[0])
+            return
+        collection = self._collection
+        # Slices (and the content/no-content split inside each) run as separate
+        # requests, so a repeated id must appear only once: keep its last
+        # occurrence, as a single request would.
+        items = list({item[0]: item for item in items}.values())
+        async with self._writing():
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        _upsert_batch, collection, items[i : i + _WRITE_BATCH_SIZE]
+                    )
+                    for i in range(0, len(items), _WRITE_BATCH_SIZE)
+                )
+            )
 
     async def search(
         self, vector: list[float], top_k: int, filters: dict
@@ -92,7 +240,7 @@ async def search(
         self._require_initialized()
         collection = self._collection
 
-        count = await asyncio.to_thread(collection.count)
+        count = await self._total_count()
         if count == 0:
             return []
 
@@ -107,19 +255,39 @@ async def search(
             include=["metadatas", "distances"],
         )
 
-        hits: list[tuple[str, float, dict]] = []
-        for id_, distance, metadata in zip(
-            results["ids"][0],
-            results["distances"][0],
-            results["metadatas"][0],
-        ):
-            hits.append((id_, _chroma_to_score(self._metric, distance), dict(metadata)))
-        return hits
+        to_score = _CHROMA_SCORE[self._metric]
+        # Chroma deserializes fresh metadata dicts on every call, so they are
+        # handed on as-is rather than copied a second time.
+        return [
+            (id_, to_score(distance), metadata if metadata is not None else {})
+            for id_, distance, metadata in zip(
+                results["ids"][0],
+                results["distances"][0],
+                results["metadatas"][0],
+            )
+        ]
 
     async def delete(self, id: str) -> None:
         self._require_initialized()
         collection = self._collection
-        await asyncio.to_thread(collection.delete, ids=[id])
+        async with self._writing():
+            await asyncio.to_thread(collection.delete, ids=[id])
+
+    async def delete_many(self, ids: list[str]) -> None:
+        self._require_initialized()
+        if not ids:
+            return
+        collection = self._collection
+        # Same per-request record cap as writes; slices go out concurrently.
+        async with self._writing():
+            await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        collection.delete, ids=ids[i : i + _WRITE_BATCH_SIZE]
+                    )
+                    for i in range(0, len(ids), _WRITE_BATCH_SIZE)
+                )
+            )
 
     async def delete_where(self, filters: dict) -> None:
         self._require_initialized()
@@ -127,29 +295,23 @@ async def delete_where(self, filters: dict) -> None:
             return
         collection = self._collection
         where = _to_chroma_where(filters)
-        await asyncio.to_thread(collection.delete, where=where)
+        async with self._writing():
+            await asyncio.to_thread(collection.delete, where=where)
 
     async def list_where(self, filters: dict, limit: int) -> list[tuple[str, dict]]:
         self._require_initialized()
         collection = self._collection
         where = _to_chroma_where(filters) if filters else None
-        ids, metadatas = await asyncio.to_thread(
-            _get_paged, collection, where, limit, ["metadatas"]
-        )
-        return [
-            (id_, dict(metadata) if metadata is not None else {})
-            for id_, metadata in zip(ids, metadatas)
-        ]
+        return await asyncio.to_thread(_list_paged, collection, where, limit)
 
     async def count(self, filters: dict) -> int:
         self._require_initialized()
         collection = self._collection
         if not filters:
-            return await asyncio.to_thread(collection.count)
-        ids, _ = await asyncio.to_thread(
-            _get_paged, collection, _to_chroma_where(filters), None, []
+            return await self._total_count()
+        return await asyncio.to_thread(
+            _count_paged, collection, _to_chroma_where(filters)
         )
-        return len(ids)
 
 
 class ChromaBackend(_ChromaBase):
@@ -163,6 +325,9 @@ class ChromaBackend(_ChromaBase):
       - path only          → PersistentClient (local disk)
       - host + port        → HttpClient (remote server)
 
+    Backends with the same host and port share one HttpClient (and its
+    connection pool) across collections.
+
     For Chroma Cloud, use ChromaCloudBackend instead.
     """
 
@@ -179,6 +344,7 @@ def __init__(
         host: str | None = None,
         port: int | None = None,
         metric: DistanceMetric = DistanceMetric.COSINE,
+        count_ttl: float = 0.0,
     ) -> None:
         """
         Args:
@@ -191,12 +357,18 @@ def __init__(
             metric: Distance metric used for similarity search. Sets the
                 ``hnsw:space`` metadata on the collection at creation time and
                 cannot be changed afterwards. Defaults to cosine.
+            count_ttl: Seconds to reuse the unfiltered collection count,
+                which every ``search`` and unfiltered ``count`` reads. Writes
+                through this backend always refresh it. Defaults to 0
+                (no caching); enable it when this backend is the only
+                writer or slightly stale counts are acceptable.
         """
         self._collection_name = collection_name
         self._path = path
         self._host = host
         self._port = port
         self._metric = metric
+        self._count_ttl = count_ttl
         self._collection = None
 
     @classmethod
@@ -208,9 +380,17 @@ async def create(
         host: str | None = None,
         port: int | None = None,
         metric: DistanceMetric = DistanceMetric.COSINE,
+        count_ttl: float = 0.0,
     ) -> Self:
         """Create and initialize a ChromaBackend in one step."""
-        backend = cls(collection_name, path=path, host=host, port=port, metric=metric)
+        backend = cls(
+            collection_name,
+            path=path,
+            host=host,
+            port=port,
+            metric=metric,
+            count_ttl=count_ttl,
+        )
         await backend.initialize()
         return backend
 
@@ -230,7 +410,9 @@ def _setup():
             if self._path:
                 client = chromadb.PersistentClient(path=self._path)
             elif self._host and self._port:
-                client = chromadb.HttpClient(host=self._host, port=self._port)
+                client = _shared_client(
+                    chromadb.HttpClient, host=self._host, port=self._port
+                )
             else:
                 client = chromadb.EphemeralClient()
             return client.get_or_create_collection(
@@ -251,6 +433,9 @@ class ChromaCloudBackend(_ChromaBase):
     Embeddings must be generated client-side (e.g. via a railtracks embedder)
     and passed as ``vector`` to every ``upsert`` and ``search`` call, just like
     the local ``ChromaBackend``.
+
+    Backends with the same api_key, tenant and database share one CloudClient
+    (and its connection pool) across collections.
     """
 
     _NOT_INITIALIZED = (
@@ -266,6 +451,7 @@ def __init__(
         tenant: str,
         database: str,
         metric: DistanceMetric = DistanceMetric.COSINE,
+        count_ttl: float = 0.0,
     ) -> None:
         """
         Args:
@@ -277,12 +463,16 @@ def __init__(
             metric: Distance metric used for score conversion. Unlike local
                 backends, this does **not** set ``hnsw:space`` — the index
                 space is managed server-side. Defaults to cosine.
+            count_ttl: Seconds to reuse the unfiltered collection count; see
+                ``ChromaBackend``. Saves a network round-trip per search.
+                Defaults to 0 (no caching).
         """
         self._collection_name = collection_name
         self._api_key = api_key
         self._tenant = tenant
         self._database = database
         self._metric = metric
+        self._count_ttl = count_ttl
         self._collection = None
 
     @classmethod
@@ -294,6 +484,7 @@ async def create(
         tenant: str,
         database: str,
         metric: DistanceMetric = DistanceMetric.COSINE,
+        count_ttl: float = 0.0,
     ) -> Self:
         """Create and initialize a ChromaCloudBackend in one step."""
         backend = cls(
@@ -302,6 +493,7 @@ async def create(
             tenant=tenant,
             database=database,
             metric=metric,
+            count_ttl=count_ttl,
         )
         await backend.initialize()
         return backend
@@ -322,7 +514,8 @@ async def initialize(self) -> None:
         collection_name = self._collection_name
 
         def _setup():
-            client = chromadb.CloudClient(
+            client = _shared_client(
+                chromadb.CloudClient,
                 api_key=api_key,
                 tenant=tenant,
                 database=database,
@@ -2,7 +2,9 @@
 
 import asyncio
 import json
+from itertools import islice
 from pathlib import Path
+from typing import Literal, NamedTuple
 
 import numpy as np
 
@@ -12,14 +14,28 @@
 
 logger = get_rt_logger(__name__)
 
+Quantization = Literal["none", "int8"]
+
 
 class InMemoryBackend:
     """Reference VectorBackend using numpy.
 
     Thread-safe via asyncio.Lock. When snapshot_path is provided the state is
     loaded from that file on construction and flushed back to it after every
-    mutating operation (upsert, delete, delete_where), giving lightweight
+    mutating operation (upsert, upsert_many, delete, delete_where), giving lightweight
     persistence without any external dependencies.
+
+    With ``quantization="int8"`` each vector is held as int8 plus one float
+    scale (symmetric, per vector), cutting resident memory roughly 8x versus
+    float64 at a small cost in score precision. Scores are computed on the
+    dequantized values and the snapshot stays in float form, so it can be
+    reloaded with or without quantization.
+
+    ``rerank_multiplier`` enables an approximate fast path for large corpora:
+    every stored vector also keeps a packed sign bit per dimension, search
+    shortlists the ``top_k * rerank_multiplier`` candidates nearest to the
+    query by Hamming distance over those bits, and only the shortlist is
+    scored exactly. Off by default, so search stays exhaustive.
     """
 
     def __init__(
@@ -27,39 +43,93 @@ def __init__(
         snapshot_path: str | Path | None = None,
         *,
         metric: DistanceMetric = DistanceMetric.COSINE,
+        quantization: Quantization = "none",
+        rerank_multiplier: int | None = None,
     ) -> None:
-        self._vectors: dict[str, list[float]] = {}
+        if quantization not in ("none", "int8"):
+            raise ValueError(
+                f"quantization must be 'none' or 'int8', got {quantization!r}"
+            )
+        if rerank_multiplier is not None and rerank_multiplier < 1:
+            raise ValueError(
+                f"rerank_multiplier must be at least 1, got {rerank_multiplier}"
+            )
+        self._rerank_multiplier = rerank_multiplier
+        self._quantization = quantization
+        # Vectors are held as arrays so search stacks raw buffers instead of
+        # re-boxing every float on each query. Under int8 quantization the
+        # per-vector scales live in _scales.
+        self._vectors: dict[str, np.ndarray] = {}
+        self._scales: dict[str, float] = {}
         self._payloads: dict[str, dict] = {}
+        # Stacked view of the corpus reused across searches; any write drops it
+        # and the next search rebuilds it. See _corpus.
+        self._corpus_cache: _Corpus | None = None
         self._lock = asyncio.Lock()
         self._metric = metric
         self._snapshot_path = Path(snapshot_path) if snapshot_path is not None else None
 
         if self._snapshot_path is not None and self._snapshot_path.exists():
             data = json.loads(self._snapshot_path.read_text())
-            self._vectors = data.get("vectors", {})
+            for id, vector in data.get("vectors", {}).items():
+                self._put_vector(id, vector)
             self._payloads = data.get("payloads", {})
 
     async def upsert(self, id: str, vector: list[float], payload: dict) -> None:
         async with self._lock:
-            self._vectors[id] = vector
-            self._payloads[id] = payload
+            self._put_vector(id, vector)
+            # Stored as a copy, like the serializing backends, so a caller that
+            # reuses or mutates its payload dict cannot change stored entries.
+            self._payloads[id] = dict(payload)
+            self._corpus_cache = None
+            await self._flush()
+
+    async def upsert_many(self, items: list[tuple[str, list[float], dict]]) -> None:
+        """Insert or replace several entries with a single snapshot flush."""
+        if not items:
+            return
+        async with self._lock:
+            # Bound once so the loop body does local loads, not attribute ones.
+            payloads = self._payloads
+            if self._quantization == "int8" and len(items) > 1:
+                self._put_int8_batch(items)
+                for id, _, payload in items:
+                    payloads[id] = dict(payload)
+            else:
+                put_vector = self._put_vector
+                for id, vector, payload in items:
+                    put_vector(id, vector)
+                    payloads[id] = dict(payload)
+            self._corpus_cache = None
             await self._flush()
 
     async def search(
         self, vector: list[float], top_k: int, filters: dict
     ) -> list[tuple[str, float, dict]]:
         async with self._lock:
-            candidates = [
-                id
-                for id, payload in self._payloads.items()
-                if _matches_filters(payload, filters)
-            ]
-
-            if not candidates:
+            payloads = self._payloads
+            corpus = self._corpus()
+            if corpus is None:
                 return []
+            # Filters narrow the candidate rows before any vector is scored;
+            # with no filters the whole stacked corpus is scored as is.
+            if filters:
+                rows = [
+                    i
+                    for i, payload in enumerate(payloads.values())
+                    if _matches_filters(payload, filters)
+                ]
+                if not rows:
+                    return []
+                corpus = corpus.take(rows)
 
             query_vec = np.asarray(vector, dtype=np.float64)
-            stored = np.array([self._vectors[c] for c in candidates], dtype=np.float64)
+            corpus = self._binary_shortlist(corpus, query_vec, top_k)
+            candidates = corpus.ids
+            stored = corpus.matrix
+            scales = corpus.scales
+            if scales is not None:
+                stored = stored * scales[:, None]
 
             # Suppress FP warnings during scoring — pathological stored vectors
             # (NaN/inf from a misbehaving embedder, subnormal norms) get
@@ -68,13 +138,8 @@ async def search(
                 if self._metric is DistanceMetric.COSINE:
                     q_norm = np.linalg.norm(query_vec)
                     if q_norm == 0:
-                        return [
-                            (c, 0.0, dict(self._payloads[c]))
-                            for c in candidates[:top_k]
-                        ]
-                    norms = np.linalg.norm(stored, axis=1)
-                    norms[norms == 0] = 1.0
-                    scores = (stored @ query_vec) / (norms * q_norm)
+                        return [(c, 0.0, dict(payloads[c])) for c in candidates[:top_k]]
+                    scores = (stored @ query_vec) / q_norm
 
                 elif self._metric is DistanceMetric.L2:
                     distances = np.linalg.norm(stored - query_vec, axis=1)
@@ -96,17 +161,42 @@ async def search(
                     scores, nan=-np.inf, posinf=-np.inf, neginf=-np.inf
                 )
 
-            top_indices = np.argsort(scores)[::-1][:top_k]
+            if 0 < top_k < len(scores):
+                # Partition out the top_k first so only those are sorted,
+                # rather than ordering every candidate.
+                top_indices = np.argpartition(scores, -top_k)[-top_k:]
+                top_indices = top_indices[np.argsort(scores[top_indices])[::-1]]
+            else:
+                top_indices = np.argsort(scores)[::-1][:top_k]
+            # Filter and convert the selected scores in one vectorized pass so
+            # the per-hit loop only does plain indexing.
+            top_scores = scores[top_indices]
+            keep = np.isfinite(top_scores)
             return [
-                (candidates[i], float(scores[i]), dict(self._payloads[candidates[i]]))
-                for i in top_indices
-                if np.isfinite(scores[i])
+                (candidates[i], score, dict(payloads[candidates[i]]))
+                for i, score in zip(
+                    top_indices[keep].tolist(), top_scores[keep].tolist()
+                )
             ]
 
     async def delete(self, id: str) -> None:
         async with self._lock:
             self._vectors.pop(id, None)
+            self._scales.pop(id, None)
             self._payloads.pop(id, None)
+            self._corpus_cache = None
+            await self._flush()
+
+    async def delete_many(self, ids: list[str]) -> None:
+        """Delete several entries with a single snapshot flush."""
+        if not ids:
+            return
+        async with self._lock:
+            for id in ids:
+                self._vectors.pop(id, None)
+                self._scales.pop(id, None)
+                self._payloads.pop(id, None)
+            self._corpus_cache = None
             await self._flush()
 
     async def delete_where(self, filters: dict) -> None:
@@ -118,11 +208,20 @@ async def delete_where(self, filters: dict) -> None:
             ]
             for id in to_remove:
                 del self._vectors[id]
+                self._scales.pop(id, None)
                 del self._payloads[id]
+            self._corpus_cache = None
             await self._flush()
 
     async def list_where(self, filters: dict, limit: int) -> list[tuple[str, dict]]:
         async with self._lock:
+            if not filters:
+                # Unfiltered listing (e.g. SemanticSearch's index scan): every
+                # entry matches, so skip the per-payload check and slice.
+                return [
+                    (id, dict(payload))
+                    for id, payload in islice(self._payloads.items(), limit)
+                ]
             matches: list[tuple[str, dict]] = []
             for id, payload in self._payloads.items():
                 if _matches_filters(payload, filters):
@@ -141,6 +240,95 @@ async def count(self, filters: dict) -> int:
                 if _matches_filters(payload, filters)
             )
 
+    def _corpus(self) -> _Corpus | None:
+        """Return the stacked corpus, rebuilding it after a write.
+
+        Must be called while holding _lock. Rows follow _payloads order. Under
+        int8 the matrix keeps the codes and is dequantized per search, so the
+        memory saving holds.
+        """
+        if self._corpus_cache is not None or not self._payloads:
+            return self._corpus_cache
+        ids = list(self._payloads)
+        vectors = self._vectors
+        matrix = np.stack([vectors[id] for id in ids])
+        scales = None
+        if self._quantization == "int8":
+            scales_by_id = self._scales
+            scales = np.array([scales_by_id[id] for id in ids])
+        if self._metric is DistanceMetric.COSINE:
+            # Rows are scaled to unit length once here, so cosine scoring is a
+            # plain dot product divided by the query norm. Under int8 the
+            # normalization folds into the per-row scales instead.
+            dequantized = matrix * scales[:, None] if scales is not None else matrix
+            with np.errstate(invalid="ignore", over="ignore"):
+                norms = np.linalg.norm(dequantized, axis=1)
+            norms[norms == 0] = 1.0
+            with np.errstate(invalid="ignore"):
+                if scales is not None:
+                    scales = scales / norms
+                else:
+                    matrix /= norms[:, None]
+        # Sign bits are unaffected by the scales and normalization above.
+        bits = (
+            np.packbits(matrix > 0, axis=1)
+            if self._rerank_multiplier is not None
+            else None
+        )
+        self._corpus_cache = _Corpus(ids, matrix, scales, bits)
+        return self._corpus_cache
+
+    def _binary_shortlist(
+        self, corpus: _Corpus, query_vec: np.ndarray, top_k: int
+    ) -> _Corpus:
+        """Keep the rows whose sign bits are nearest the query's (Hamming).
+
+        The shortlist holds ``top_k * rerank_multiplier`` rows, still in corpus
+        order, and only those are scored exactly. Without ``rerank_multiplier``
+        the corpus is returned whole.
+        """
+        if corpus.bits is None:
+            return corpus
+        shortlist = top_k * self._rerank_multiplier
+        if not 0 < shortlist < len(corpus.ids):
+            return corpus
+        distances = _popcount_rows(corpus.bits ^ np.packbits(query_vec > 0))
+        keep = np.sort(np.argpartition(distances, shortlist - 1)[:shortlist])
+        return corpus.take(keep.tolist())
+
+    def _put_vector(self, id: str, vector: list[float] | np.ndarray) -> None:
+        arr = _as_array(vector)
+        if self._quantization == "int8":
+            arr, self._scales[id] = _quantize_int8(arr)
+        self._vectors[id] = arr
+
+    def _put_int8_batch(self, items: list[tuple[str, list[float], dict]]) -> None:
+        """Quantize a whole batch as one matrix instead of vector by vector.
+
+        Stored codes are row views of the batch matrix. Batches whose vectors
+        differ in length cannot form a matrix and fall back to per-vector
+        quantization.
+        """
+        try:
+            rows = np.array([vector for _, vector, _ in items], dtype=np.float64)
+        except ValueError:
+            rows = None
+        if rows is None or rows.ndim != 2:
+            for id, vector, _ in items:
+                self._put_vector(id, vector)
+            return
+        codes, scales = _quantize_int8_rows(rows)
+        vectors = self._vectors
+        scales_by_id = self._scales
+        for (id, _, _), row, scale in zip(items, codes, scales.tolist()):
+            vectors[id] = row
+            scales_by_id[id] = scale
+
+    def _float_vector(self, id: str) -> np.ndarray:
+        if self._quantization == "int8":
+            return self._vectors[id] * self._scales[id]
+        return self._vectors[id]
+
     async def _flush(self) -> None:
         """Persist current state to snapshot_path. Must be called while holding _lock.
 
@@ -152,9 +340,65 @@ async def _flush(self) -> None:
         """
         if self._snapshot_path is None:
             return
-        payload = json.dumps({"vectors": self._vectors, "payloads": self._payloads})
+        vectors = {id: self._float_vector(id).tolist() for id in self._vectors}
+        payload = json.dumps({"vectors": vectors, "payloads": self._payloads})
         await asyncio.to_thread(self._snapshot_path.write_text, payload)
 
 
+class _Corpus(NamedTuple):
+    ids: list[str]
+    matrix: np.ndarray
+    scales: np.ndarray | None
+    bits: np.ndarray | None
+
+    def take(self, rows: list[int]) -> _Corpus:
+        return _Corpus(
+            [self.ids[i] for i in rows],
+            self.matrix[rows],
+            self.scales[rows] if self.scales is not None else None,
+            self.bits[rows] if self.bits is not None else None,
+        )
+
+
+def _popcount_rows(rows: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a packed uint8 matrix."""
+    if hasattr(np, "bitwise_count"):  # numpy >= 2.0
+        return np.bitwise_count(rows).sum(axis=1, dtype=np.int64)
+    return np.unpackbits(rows, axis=1).sum(axis=1, dtype=np.int64)
+
+
+def _as_array(vector: list[float] | np.ndarray) -> np.ndarray:
+    return np.array(vector, dtype=np.float64)
+
+
+def _quantize_int8(vector: np.ndarray) -> tuple[np.ndarray, float]:
+    """Symmetric per-vector int8 quantization: ``vector ≈ q * scale``."""
+    codes, scales = _quantize_int8_rows(vector[np.newaxis])
+    return codes[0], float(scales[0])
+
+
+def _quantize_int8_rows(rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-row int8 quantization: ``rows ≈ q * scales[:, None]``.
+
+    A row containing NaN/inf gets zero codes and a NaN scale so it dequantizes
+    to NaN and is dropped at search time, just like an unquantized non-finite
+    vector.
+    """
+    peaks = np.abs(rows).max(axis=1, initial=0.0)
+    finite = np.isfinite(peaks)
+    scales = np.where(peaks > 0, peaks / 127.0, 1.0)
+    scales[~finite] = np.nan
+    with np.errstate(invalid="ignore", over="ignore"):
+        codes = np.round(rows / scales[:, np.newaxis])
+    codes[~finite] = 0
+    return codes.astype(np.int8), scales
+
+
 def _matches_filters(payload: dict, filters: dict) -> bool:
-    return all(payload.get(k) == v for k, v in filters.items())
+    # Runs once per stored entry on filtered scans; a plain loop with a bound
+    # ``get`` avoids building a generator for every payload.
+    get = payload.get
+    for k, v in filters.items():
+        if get(k) != v:
+            return False
+    return True
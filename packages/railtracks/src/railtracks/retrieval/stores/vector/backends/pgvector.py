@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import weakref
+from collections.abc import Callable
 from typing import Any
 
 from typing_extensions import Self
 
+from .._json import json_dumps
 from ..metric import DistanceMetric
 
 _NOT_INITIALIZED = (
@@ -19,19 +23,53 @@
 }
 
 
-def _pg_to_score(metric: DistanceMetric, distance: float) -> float:
-    """Convert a raw pgvector distance to a similarity score (higher = better).
+# pgvector operator conventions:
+#     <=>  cosine distance (1 - cos_sim)   → score = 1 - d
+#     <->  L2 distance (||a-b||)           → score = 1 / (1 + d)
+#     <#>  negative inner product (-⟨a,b⟩) → score = -d  (= dot_product)
+# Looked up once per search rather than re-dispatching on the metric per row.
+_PG_SCORE: dict[DistanceMetric, Callable[[float], float]] = {
+    DistanceMetric.COSINE: lambda d: 1.0 - d,
+    DistanceMetric.L2: lambda d: 1.0 / (1.0 + d),
+    DistanceMetric.IP: lambda d: -d,
+}
 
-    pgvector operator conventions:
-        <=>  cosine distance (1 - cos_sim)   → score = 1 - d
-        <->  L2 distance (||a-b||)           → score = 1 / (1 + d)
-        <#>  negative inner product (-⟨a,b⟩) → score = -d  (= dot_product)
-    """
-    if metric is DistanceMetric.COSINE:
-        return 1.0 - distance
-    if metric is DistanceMetric.L2:
-        return 1.0 / (1.0 + distance)
-    return -distance  # IP
+
+class _SharedPool:
+    """The task creating one shared pool, so concurrent initialize() calls
+    await a single creation."""
+
+    __slots__ = ("task", "__weakref__")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        self.task = task
+
+
+# Backends on the same DSN (e.g. one per table) share one asyncpg pool so
+# additional tables reuse warm connections instead of opening their own.
+# asyncpg pools are bound to the event loop that created them, so the cache
+# is per loop. Both levels hold their entries weakly: the task and pool refer
+# back to the loop, so a strong reference here would pin every loop (and its
+# pool) forever. Backends keep their _SharedPool alive; once the last backend
+# on a loop is gone, the entry and then the loop's slot are collected.
+_SHARED_POOLS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, weakref.WeakValueDictionary[tuple, _SharedPool]
+] = weakref.WeakKeyDictionary()
+
+
+def _pool_key(dsn: str, pool_kwargs: dict[str, Any]) -> tuple | None:
+    """Cache key for a pool, or ``None`` when ``pool_kwargs`` is unhashable."""
+    key = (dsn, *sorted(pool_kwargs.items()))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _pg_to_score(metric: DistanceMetric, distance: float) -> float:
+    """Convert a raw pgvector distance to a similarity score (higher = better)."""
+    return _PG_SCORE[metric](distance)
 
 
 def _build_where(filters: dict, start_index: int = 1) -> tuple[str, list]:
@@ -47,15 +85,12 @@ def _build_where(filters: dict, start_index: int = 1) -> tuple[str, list]:
     """
     if not filters:
         return "", []
-    conditions: list[str] = []
-    params: list = []
-    idx = start_index
-    for k, v in filters.items():
-        conditions.append(f"payload->${idx}::text = ${idx + 1}::jsonb")
-        params.append(k)
-        params.append(json.dumps(v))
-        idx += 2
-    return "WHERE " + " AND ".join(conditions), params
+    conditions = " AND ".join(
+        f"payload->${idx}::text = ${idx + 1}::jsonb"
+        for idx in range(start_index, start_index + 2 * len(filters), 2)
+    )
+    params = [p for k, v in filters.items() for p in (k, json.dumps(v))]
+    return "WHERE " + conditions, params
 
 
 def _decode_payload(raw) -> dict:
@@ -79,6 +114,13 @@ class PgvectorBackend:
         pool_kwargs: Extra keyword arguments forwarded to ``asyncpg.create_pool``.
                 Use this to tune ``min_size`` / ``max_size`` / ``max_inactive_connection_lifetime``
                 for production workloads.
+        write_batch_size: Maximum rows per ``executemany`` in ``upsert_many``.
+                Larger batches are split and the slices written concurrently,
+                each on its own pooled connection and committed on its own,
+                so a failed slice does not roll back the others. Defaults to 500.
+
+    Backends created on the same event loop with the same ``dsn`` and
+    ``pool_kwargs`` share one connection pool.
     """
 
     def __init__(
@@ -89,13 +131,20 @@ def __init__(
         dim: int | None = None,
         metric: DistanceMetric = DistanceMetric.COSINE,
         pool_kwargs: dict[str, Any] | None = None,
+        write_batch_size: int = 500,
     ) -> None:
+        if write_batch_size < 1:
+            raise ValueError(
+                f"write_batch_size must be at least 1, got {write_batch_size}"
+            )
         self._dsn = dsn
         self._table = table
         self._dim = dim
         self._metric = metric
         self._pool_kwargs = dict(pool_kwargs) if pool_kwargs else {}
+        self._write_batch_size = write_batch_size
         self._pool = None
+        self._shared_pool: _SharedPool | None = None
 
     def _require_initialized(self) -> None:
         if self._pool is None:
@@ -110,9 +159,17 @@ async def create(
         dim: int | None = None,
         metric: DistanceMetric = DistanceMetric.COSINE,
         pool_kwargs: dict[str, Any] | None = None,
+        write_batch_size: int = 500,
     ) -> Self:
         """Create and initialize a PgvectorBackend in one step."""
-        backend = cls(dsn, table=table, dim=dim, metric=metric, pool_kwargs=pool_kwargs)
+        backend = cls(
+            dsn,
+            table=table,
+            dim=dim,
+            metric=metric,
+            pool_kwargs=pool_kwargs,
+            write_batch_size=write_batch_size,
+        )
         await backend.initialize()
         return backend
 
@@ -129,38 +186,94 @@ async def initialize(self) -> None:
         async def _init_conn(conn) -> None:
             await register_vector(conn)
 
-        self._pool = await asyncpg.create_pool(
-            self._dsn, init=_init_conn, **self._pool_kwargs
-        )
+        def _create_pool():
+            return asyncio.ensure_future(
+                asyncpg.create_pool(self._dsn, init=_init_conn, **self._pool_kwargs)
+            )
+
+        key = _pool_key(self._dsn, self._pool_kwargs)
+        if key is None:
+            self._pool = await _create_pool()
+        else:
+            pools = _SHARED_POOLS.setdefault(
+                asyncio.get_running_loop(), weakref.WeakValueDictionary()
+            )
+            shared = pools.get(key)
+            failed = (
+                shared is not None
+                and shared.task.done()
+                and (shared.task.cancelled() or shared.task.exception() is not None)
+            )
+            if shared is None or failed:
+                shared = pools[key] = _SharedPool(_create_pool())
+            # The cache only holds it weakly; this backend keeps it alive.
+            self._shared_pool = shared
+            # Shielded so one caller being cancelled does not cancel the
+            # creation other backends are waiting on.
+            self._pool = await asyncio.shield(shared.task)
 
         vec_type = f"vector({self._dim})" if self._dim else "vector"
+        # Argument-less execute() uses the simple query protocol, which runs
+        # both statements in a single round-trip.
         async with self._pool.acquire() as conn:
-            await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
             await conn.execute(
                 f"""
+                CREATE EXTENSION IF NOT EXISTS vector;
                 CREATE TABLE IF NOT EXISTS "{self._table}" (
                     id        TEXT PRIMARY KEY,
                     embedding {vec_type},
                     payload   JSONB NOT NULL DEFAULT '{{}}'::jsonb
-                )
+                );
                 """
             )
 
-    async def upsert(self, id: str, vector: list[float], payload: dict) -> None:
-        self._require_initialized()
-        async with self._pool.acquire() as conn:
-            await conn.execute(
-                f"""
+    def _upsert_sql(self) -> str:
+        return f"""
                 INSERT INTO "{self._table}" (id, embedding, payload)
                 VALUES ($1, $2, $3::jsonb)
                 ON CONFLICT (id) DO UPDATE
                     SET embedding = EXCLUDED.embedding,
                         payload   = EXCLUDED.payload
-                """,
-                id,
-                vector,
-                json.dumps(payload),
-            )
+                """
+
+    async def upsert(self, id: str, vector: list[float], payload: dict) -> None:
+        self._require_initialized()
+        async with self._pool.acquire() as conn:
+            await conn.execute(self._upsert_sql(), id, vector, json_dumps(payload))
+
+    async def upsert_many(self, items: list[tuple[str, list[float], dict]]) -> None:
+        """Insert or replace several rows.
+
+        Up to ``write_batch_size`` rows go out as one atomic ``executemany``.
+        Larger batches are split into slices written concurrently on separate
+        connections, each committing independently: if one slice fails the
+        error is raised, but any other slice may already be committed. The
+        call is idempotent, so retrying the whole batch is safe.
+        """
+        self._require_initialized()
+        if not items:
+            return
+        if len(items) == 1:
+            # executemany's per-call batching setup buys nothing for one row.
+            await self.upsert(*items[0])
+            return
+        sql = self._upsert_sql()
+        size = self._write_batch_size
+        if len(items) > size:
+            # Slices run concurrently, so a repeated id must not land in two
+            # of them: keep its last occurrence, as a single statement would.
+            items = list({item[0]: item for item in items}.values())
+
+        async def _write(batch: list[tuple[str, list[float], dict]]) -> None:
+            rows = [(id, vector, json_dumps(payload)) for id, vector, payload in batch]
+            async with self._pool.acquire() as conn:
+                await conn.executemany(sql, rows)
+
+        # Each slice takes its own pooled connection, so their round-trips
+        # overlap; the pool's max_size bounds how many are in flight.
+        await asyncio.gather(
+            *(_write(items[i : i + size]) for i in range(0, len(items), size))
+        )
 
     async def search(
         self, vector: list[float], top_k: int, filters: dict
@@ -181,10 +294,11 @@ async def search(
         async with self._pool.acquire() as conn:
             rows = await conn.fetch(sql, vector, *params)
 
+        to_score = _PG_SCORE[self._metric]
         return [
             (
                 row["id"],
-                _pg_to_score(self._metric, float(row["distance"])),
+                to_score(float(row["distance"])),
                 _decode_payload(row["payload"]),
             )
             for row in rows
@@ -195,6 +309,15 @@ async def delete(self, id: str) -> None:
         async with self._pool.acquire() as conn:
             await conn.execute(f'DELETE FROM "{self._table}" WHERE id = $1', id)
 
+    async def delete_many(self, ids: list[str]) -> None:
+        self._require_initialized()
+        if not ids:
+            return
+        async with self._pool.acquire() as conn:
+            await conn.execute(
+                f'DELETE FROM "{self._table}" WHERE id = ANY($1::text[])', list(ids)
+            )
+
     async def delete_where(self, filters: dict) -> None:
         self._require_initialized()
         if not filters:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime, timezone
 from typing import Any, Protocol
 from uuid import UUID
@@ -8,12 +9,14 @@
 from railtracks.utils.logging.create import get_rt_logger
 
 from ..models import (
+    _SCOPE_PREFIX,
     Entity,
     RetrievedStoreEntry,
     StoreEntry,
     StoreQuery,
     StoreScope,
 )
+from ._json import json_dumps
 
 logger = get_rt_logger(__name__)
 
@@ -34,20 +37,28 @@ async def list_where(self, filters: dict, limit: int) -> list[tuple[str, dict]]:
     async def count(self, filters: dict) -> int: ...
 
 
+# Backends may additionally implement
+#   async def upsert_many(self, items: list[tuple[str, list[float], dict]]) -> None
+# to write a batch of ``(id, vector, payload)`` in a single round-trip.
+# VectorStore.write_many falls back to per-item upsert() when it is absent.
+# Likewise
+#   async def delete_many(self, ids: list[str]) -> None
+# removes several ids in one round-trip; callers fall back to delete().
+
+
 # ---------------------------------------------------------------------------
 # Payload serialization helpers
 # ---------------------------------------------------------------------------
 
 
-def _encode_provenance(entry: StoreEntry) -> dict:
-    out: dict = {}
+def _encode_provenance(entry: StoreEntry, out: dict) -> None:
     if entry.parent_chunk_id is not None:
         out["parent_chunk_id"] = str(entry.parent_chunk_id)
     if entry.chunk_offsets is not None:
-        out["chunk_offsets"] = json.dumps(list(entry.chunk_offsets))
+        out["chunk_offsets"] = json_dumps(list(entry.chunk_offsets))
     if entry.chunk_metadata:
         # JSON-encoded for clean roundtrip back into chunk_metadata.
-        out["chunk_metadata"] = json.dumps(entry.chunk_metadata)
+        out["chunk_metadata"] = json_dumps(entry.chunk_metadata)
         # Also spread scalar values at top level so they are filterable
         # via `metadata_filters` / `find` with a flat equality dict.
         for k, v in entry.chunk_metadata.items():
@@ -55,11 +66,9 @@ def _encode_provenance(entry: StoreEntry) -> dict:
                 out[k] = v
     if entry.embedding_version is not None:
         out["embedding_version"] = entry.embedding_version
-    return out
 
 
-def _encode_enrichment(entry: StoreEntry) -> dict:
-    out: dict = {}
+def _encode_enrichment(entry: StoreEntry, out: dict) -> None:
     if entry.scope is not None:
         out.update(entry.scope.to_payload_filters())
     if entry.abstract is not None:
@@ -71,7 +80,7 @@ def _encode_enrichment(entry: StoreEntry) -> dict:
     if entry.valid_until is not None:
         out["valid_until"] = entry.valid_until.isoformat()
     if entry.entities is not None:
-        out["entities"] = json.dumps(
+        out["entities"] = json_dumps(
             [
                 {
                     "name": e.name,
@@ -82,7 +91,6 @@ def _encode_enrichment(entry: StoreEntry) -> dict:
                 for e in entry.entities
             ]
         )
-    return out
 
 
 def _entry_to_payload(entry: StoreEntry) -> dict:
@@ -94,30 +102,35 @@ def _entry_to_payload(entry: StoreEntry) -> dict:
         "embedding_model": entry.embedding_model,
         "created_at": entry.created_at.isoformat(),
     }
-    payload.update(_encode_provenance(entry))
-    payload.update(_encode_enrichment(entry))
+    # The encoders write straight into ``payload`` rather than building
+    # intermediate dicts to merge — this runs once per written entry.
+    _encode_provenance(entry, payload)
+    _encode_enrichment(entry, payload)
     return payload
 
 
 def _payload_to_entry(id: str, payload: dict) -> StoreEntry:
-    offsets_raw = payload.get("chunk_offsets")
+    # Each optional key is probed exactly once via ``get``; absent keys and
+    # explicit nulls decode the same way.
+    get = payload.get
+
     offsets: tuple[int, int] | None = None
+    offsets_raw = get("chunk_offsets")
     if offsets_raw is not None:
         parsed = (
             json.loads(offsets_raw) if isinstance(offsets_raw, str) else offsets_raw
         )
         offsets = (int(parsed[0]), int(parsed[1]))
 
-    parent_chunk_id_raw = payload.get("parent_chunk_id")
+    parent_chunk_id_raw = get("parent_chunk_id")
     parent_chunk_id = UUID(parent_chunk_id_raw) if parent_chunk_id_raw else None
 
-    chunk_metadata = (
-        json.loads(payload["chunk_metadata"]) if "chunk_metadata" in payload else {}
-    )
+    chunk_metadata_raw = get("chunk_metadata")
+    chunk_metadata = json.loads(chunk_metadata_raw) if chunk_metadata_raw else {}
 
     entities: list[Entity] | None = None
-    if "entities" in payload:
-        raw = json.loads(payload["entities"])
+    entities_raw = get("entities")
+    if entities_raw is not None:
         entities = [
             Entity(
                 name=e["name"],
@@ -125,21 +138,15 @@ def _payload_to_entry(id: str, payload: dict) -> StoreEntry:
                 source_chunk_id=UUID(e["source_chunk_id"]),
                 metadata=e.get("metadata", {}),
             )
-            for e in raw
+            for e in json.loads(entities_raw)
         ]
 
-    valid_from = (
-        datetime.fromisoformat(payload["valid_from"])
-        if "valid_from" in payload
-        else None
-    )
-    valid_until = (
-        datetime.fromisoformat(payload["valid_until"])
-        if "valid_until" in payload
-        else None
-    )
+    valid_from_raw = get("valid_from")
+    valid_from = datetime.fromisoformat(valid_from_raw) if valid_from_raw else None
+    valid_until_raw = get("valid_until")
+    valid_until = datetime.fromisoformat(valid_until_raw) if valid_until_raw else None
 
-    created_at_raw = payload.get("created_at")
+    created_at_raw = get("created_at")
     created_at = (
         datetime.fromisoformat(created_at_raw)
         if created_at_raw
@@ -154,17 +161,19 @@ def _payload_to_entry(id: str, payload: dict) -> StoreEntry:
         embedding_model=payload["embedding_model"],
         chunk_id=UUID(payload["chunk_id"]),
         document_id=UUID(payload["document_id"]),
-        chunk_index=int(payload.get("chunk_index", 0)),
-        abstract=payload.get("abstract"),
-        summary=payload.get("summary"),
+        chunk_index=int(get("chunk_index", 0)),
+        abstract=get("abstract"),
+        summary=get("summary"),
+        # startswith already proved the prefix, so slice it off rather than
+        # letting removeprefix test it a second time.
         scope=StoreScope(
             labels={
-                k.removeprefix("scope_"): v
+                k[len(_SCOPE_PREFIX) :]: v
                 for k, v in payload.items()
-                if k.startswith("scope_")
+                if k.startswith(_SCOPE_PREFIX)
             }
         ),
-        embedding_version=payload.get("embedding_version"),
+        embedding_version=get("embedding_version"),
         parent_chunk_id=parent_chunk_id,
         chunk_offsets=offsets,
         chunk_metadata=chunk_metadata,
@@ -175,6 +184,26 @@ def _payload_to_entry(id: str, payload: dict) -> StoreEntry:
     )
 
 
+def _require_vector(entry: StoreEntry) -> None:
+    if entry.vector is None:
+        raise ValueError(
+            f"VectorStore.write requires entry.vector to be set "
+            f"(entry_id={entry.id}); embed the chunk before writing."
+        )
+
+
+def _iter_retrieved(
+    raw_hits: Iterable[tuple[str, float, dict]],
+) -> Iterator[RetrievedStoreEntry]:
+    """Lazily decode ranked backend hits into RetrievedStoreEntry objects."""
+    # Positional arguments (entry, score, rank, source_retriever) skip keyword
+    # binding in this per-hit constructor.
+    for rank, (hit_id, score, payload) in enumerate(raw_hits):
+        yield RetrievedStoreEntry(
+            _payload_to_entry(hit_id, payload), score, rank, "dense"
+        )
+
+
 # ---------------------------------------------------------------------------
 # VectorStore
 # ---------------------------------------------------------------------------
@@ -190,15 +219,32 @@ def __init__(self, backend: VectorBackend) -> None:
         self._backend = backend
 
     async def write(self, entry: StoreEntry) -> str:
-        if entry.vector is None:
-            raise ValueError(
-                f"VectorStore.write requires entry.vector to be set "
-                f"(entry_id={entry.id}); embed the chunk before writing."
-            )
-        await self._backend.upsert(
-            str(entry.id), entry.vector, _entry_to_payload(entry)
-        )
-        return str(entry.id)
+        _require_vector(entry)
+        entry_id = str(entry.id)
+        await self._backend.upsert(entry_id, entry.vector, _entry_to_payload(entry))
+        return entry_id
+
+    async def write_many(self, entries: Sequence[StoreEntry]) -> list[str]:
+        """Write several entries, batching the backend call when supported.
+
+        Every entry is validated before anything is written, so a missing
+        vector leaves the store untouched. Returns the ids in input order.
+        """
+        # Validation and payload encoding share one pass; nothing reaches the
+        # backend until every entry has been checked.
+        items = []
+        for entry in entries:
+            _require_vector(entry)
+            items.append((str(entry.id), entry.vector, _entry_to_payload(entry)))
+        if not items:
+            return []
+        upsert_many = getattr(self._backend, "upsert_many", None)
+        if upsert_many is not None:
+            await upsert_many(items)
+        else:
+            for id, vector, payload in items:
+                await self._backend.upsert(id, vector, payload)
+        return [id for id, _, _ in items]
 
     async def read(self, query: StoreQuery) -> list[RetrievedStoreEntry]:
         if query.embedding is None:
@@ -206,6 +252,8 @@ async def read(self, query: StoreQuery) -> list[RetrievedStoreEntry]:
                 "VectorStore.read requires query.embedding to be set; "
                 "caller must supply a pre-computed embedding."
             )
+        if query.top_k <= 0:
+            return []
 
         filters: dict[str, Any] = (
             query.scope.to_payload_filters() if query.scope is not None else {}
@@ -215,18 +263,7 @@ async def read(self, query: StoreQuery) -> list[RetrievedStoreEntry]:
 
         raw_hits = await self._backend.search(query.embedding, query.top_k, filters)
 
-        results: list[RetrievedStoreEntry] = []
-        for rank, (hit_id, score, payload) in enumerate(raw_hits):
-            entry = _payload_to_entry(hit_id, payload)
-            results.append(
-                RetrievedStoreEntry(
-                    entry=entry,
-                    score=score,
-                    rank=rank,
-                    source_retriever="dense",
-                )
-            )
-        return results
+        return list(_iter_retrieved(raw_hits))
 
     async def delete(self, id: UUID) -> None:
         await self._backend.delete(str(id))
@@ -238,6 +275,8 @@ async def delete_where(self, filters: dict[str, Any]) -> None:
         await self._backend.delete_where(filters)
 
     async def find(self, filters: dict[str, Any], limit: int = 1) -> list[StoreEntry]:
+        if limit <= 0:
+            return []
         raw_hits = await self._backend.list_where(filters, limit)
         return [_payload_to_entry(hit_id, payload) for hit_id, payload in raw_hits]
 
@@ -250,18 +289,9 @@ async def nearest_neighbors(
         k: int,
         scope: StoreScope | None = None,
     ) -> list[RetrievedStoreEntry]:
+        if k <= 0:
+            return []
         filters = scope.to_payload_filters() if scope is not None else {}
         raw_hits = await self._backend.search(embedding, k, filters)
 
-        results: list[RetrievedStoreEntry] = []
-        for rank, (hit_id, score, payload) in enumerate(raw_hits):
-            entry = _payload_to_entry(hit_id, payload)
-            results.append(
-                RetrievedStoreEntry(
-                    entry=entry,
-                    score=score,
-                    rank=rank,
-                    source_retriever="dense",
-                )
-            )
-        return results
+        return list(_iter_retrieved(raw_hits))
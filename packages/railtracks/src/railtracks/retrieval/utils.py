@@ -1,3 +1,5 @@
+import asyncio
+import contextlib
 from collections.abc import AsyncGenerator, AsyncIterable
 from typing import TypeVar
 
@@ -17,3 +19,35 @@ async def abatched(
             batch = []
     if batch:
         yield batch
+
+
+async def aprefetch(iterable: AsyncIterable[_T]) -> AsyncGenerator[_T, None]:
+    """Yield from ``iterable`` while its next item is produced in the background.
+
+    While the consumer handles item N, item N+1 is already being awaited in a
+    separate task, so the two overlap (double buffering). At most one item is
+    fetched ahead. If the consumer stops early or raises, the in-flight fetch
+    is cancelled.
+    """
+    iterator = aiter(iterable)
+
+    async def _next() -> _T:
+        return await anext(iterator)
+
+    pending = asyncio.ensure_future(_next())
+    try:
+        while True:
+            try:
+                item = await pending
+            except StopAsyncIteration:
+                return
+            pending = asyncio.ensure_future(_next())
+            yield item
+    finally:
+        if not pending.done():
+            pending.cancel()
+        with contextlib.suppress(asyncio.CancelledError, StopAsyncIteration):
+            await pending
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
@@ -24,10 +24,13 @@ def get_all_open_heads(
     # now that we just have the dead ones we can traverse backwards
     dead_heads = []
 
+    # group once rather than rescanning every dead node for each identifier
+    by_identifier: Dict[str, set] = {}
+    for x in removed_normal_pathway:
+        by_identifier.setdefault(x.identifier, set()).add(x)
+
     for identifier in {x.identifier for x in removed_normal_pathway}:
-        relevant_nodes = {
-            x for x in removed_normal_pathway if x.identifier == identifier
-        }
+        relevant_nodes = by_identifier[identifier]
 
         parents = {x.parent for x in relevant_nodes}
         for n in relevant_nodes:
@@ -193,6 +196,8 @@ def time_machine(self, step: int | None, item_list: Optional[List[str]] = None):
             else:
                 self._heap[identifier] = item
 
+        return self
+
     def __getstate__(self):
         # we cannot serialize the _lock because it bricks things
         return {k: v for k, v in self.__dict__.items() if k != "_lock"}
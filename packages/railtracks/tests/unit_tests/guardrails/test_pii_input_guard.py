@@ -64,6 +64,17 @@ def test_phone_in_user_message(self, guard: PIIRedactInputGuard) -> None:
         assert decision.action == GuardrailAction.TRANSFORM
         assert "[PHONE_NUMBER]" in decision.messages[0].content
 
+    def test_original_message_is_left_unchanged(
+        self, guard: PIIRedactInputGuard
+    ) -> None:
+        original = UserMessage("My email is alice@example.com")
+        decision = guard(_make_input_event(MessageHistory([original])))
+        assert decision.messages is not None
+        redacted = decision.messages[0]
+        assert redacted is not original
+        assert original.content == "My email is alice@example.com"
+        assert redacted.role == Role.user
+
 
 class TestTransformSystemMessage:
     def test_pii_in_system_message(self, guard: PIIRedactInputGuard) -> None:
@@ -104,3 +104,29 @@ def test_chat_with_tools_failure(message_history, tool):
     with patch.object(litellm, "supports_function_calling", return_value=False):
         with pytest.raises(RTLLMError):
             llm.chat_with_tools(message_history, [tool])
+
+
+def test_available_models_shared_and_refreshed_on_registry_change(monkeypatch):
+    """The lower-cased model set is built once and reused until litellm's registry changes."""
+    first = AzureAILLM(model_name=TEST_CHAT_MODEL_NAME)
+    second = AzureAILLM(model_name=TEST_CHAT_MODEL_NAME)
+    assert first._available_models is second._available_models
+
+    monkeypatch.setattr(
+        litellm, "azure_ai_models", set(litellm.azure_ai_models) | {"azure_ai/New-Model"}
+    )
+    llm = AzureAILLM(model_name="azure_ai/new-model")
+    assert "azure_ai/new-model" in llm._available_models
+
+
+def test_available_models_refreshed_on_same_size_registry_replacement(monkeypatch):
+    """Swapping one model for another (same registry size) still invalidates the cache."""
+    AzureAILLM(model_name=TEST_CHAT_MODEL_NAME)
+    registry = set(litellm.azure_ai_models)
+    dropped = next(m for m in registry if m.lower() != TEST_CHAT_MODEL_NAME.lower())
+    monkeypatch.setattr(
+        litellm, "azure_ai_models", (registry - {dropped}) | {"azure_ai/Swapped-In"}
+    )
+
+    llm = AzureAILLM(model_name="azure_ai/swapped-in")
+    assert dropped.lower() not in llm._available_models
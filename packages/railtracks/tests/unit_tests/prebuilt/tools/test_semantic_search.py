@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 
 from railtracks.retrieval.embedding.base import Embedding
@@ -139,6 +140,48 @@ async def test_changed_value_reembeds_only_that_entry():
     assert embedder.texts_embedded - before == 2  # 1 changed entry + query
 
 
+async def test_query_rides_along_with_the_index_delta():
+    embedder, search = _fresh()
+    results = await search.search(ITEMS, "apples")
+    assert embedder.embed_calls == 1  # corpus delta and query in one call
+    assert results[0][0] == "fruit"
+
+    await search.search(ITEMS, "python")
+    assert embedder.embed_calls == 2  # no delta: the query is embedded alone
+
+
+async def test_large_delta_is_split_at_the_embedder_batch_size():
+    embedder, search = _fresh()
+    embedder.default_batch_size = 2
+    results = await search.search(ITEMS, "apples")
+    # 3 entries + query = 4 texts -> two slices of 2, in input order.
+    assert embedder.embed_calls == 2
+    assert embedder.texts_embedded == 4
+    assert results[0][0] == "fruit"
+
+
+async def test_delta_slices_are_embedded_one_at_a_time():
+    embedder, search = _fresh()
+    embedder.default_batch_size = 1
+    in_flight = peak = 0
+    stub_aembed = embedder.aembed
+
+    async def tracking_aembed(texts):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        try:
+            return await stub_aembed(texts)
+        finally:
+            in_flight -= 1
+
+    embedder.aembed = tracking_aembed  # type: ignore[method-assign]
+    await search.search(ITEMS, "apples")
+    assert embedder.embed_calls == 4
+    assert peak == 1
+
+
 async def test_removed_key_is_dropped_from_results():
     _embedder, search = _fresh()
     items = dict(ITEMS)
@@ -159,6 +202,51 @@ async def test_emptying_store_prunes_the_index():
     assert embedder.embed_calls == before
 
 
+async def test_stale_keys_are_deleted_with_one_backend_call():
+    class _CountingBackend(InMemoryBackend):
+        delete_many_calls = 0
+
+        async def delete_many(self, ids):
+            self.delete_many_calls += 1
+            await super().delete_many(ids)
+
+        async def delete(self, id):
+            raise AssertionError("per-key delete should not be used")
+
+    backend = _CountingBackend()
+    search = SemanticSearch(StubEmbedder(), backend)
+    await search.search(ITEMS, "apples")
+
+    await search.search({}, "apples")
+
+    assert backend.delete_many_calls == 1
+    assert await backend.count({}) == 0
+
+
+async def test_stale_keys_are_deleted_concurrently_without_delete_many():
+    class _SlowDeleteBackend(InMemoryBackend):
+        # Hide the batch method so the per-key fallback is exercised.
+        delete_many = None
+        in_flight = 0
+        peak = 0
+
+        async def delete(self, id):
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+            await asyncio.sleep(0)
+            await super().delete(id)
+            self.in_flight -= 1
+
+    backend = _SlowDeleteBackend()
+    search = SemanticSearch(StubEmbedder(), backend)
+    await search.search(ITEMS, "apples")
+
+    await search.search({}, "apples")
+
+    assert backend.peak == len(ITEMS)
+    assert await backend.count({}) == 0
+
+
 # ---------------------------------------------------------------------------
 # Persistence: a restart reuses embeddings via the backend snapshot
 # ---------------------------------------------------------------------------
@@ -182,6 +270,25 @@ async def test_persisted_backend_reused_across_instances(tmp_path):
     assert hits[0][0] == "language"
 
 
+async def test_index_delta_is_written_with_one_backend_call():
+    class _CountingBackend(InMemoryBackend):
+        upsert_many_calls = 0
+
+        async def upsert_many(self, items):
+            self.upsert_many_calls += 1
+            await super().upsert_many(items)
+
+        async def upsert(self, id, vector, payload):
+            raise AssertionError("per-item upsert should not be used")
+
+    backend = _CountingBackend()
+    hits = await SemanticSearch(StubEmbedder(), backend).search(ITEMS, "apples")
+
+    assert backend.upsert_many_calls == 1
+    assert await backend.count({}) == len(ITEMS)
+    assert hits[0][0] == "fruit"
+
+
 # ---------------------------------------------------------------------------
 # Public surface
 # ---------------------------------------------------------------------------
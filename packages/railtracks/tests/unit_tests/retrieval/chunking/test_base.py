@@ -78,6 +78,17 @@ def test_make_chunks_metadata_is_isolated():
     assert chunks[0].metadata["shared"] is doc.metadata["shared"]
 
 
+def test_make_chunks_shared_extra_metadata_is_not_aliased():
+    doc = Document(content="ab", type="text", metadata={"source": "test"})
+    chunker = _PassthroughChunker()
+    shared = {"section": "intro"}
+    chunks = chunker._make_chunks(doc, ["a", "b"], extra_metadata=[shared, shared])
+
+    chunks[0].metadata["section"] = "changed"
+    assert chunks[1].metadata == {"source": "test", "section": "intro"}
+    assert shared == {"section": "intro"}
+
+
 def test_make_chunks_rejects_offsets_length_mismatch():
     doc = Document(content="ab", type="text")
     chunker = _PassthroughChunker()
@@ -77,6 +77,68 @@ def test_injected_tokenizer():
     assert chunker.tokenizer is custom
 
 
+# -------------------------------------------------------------------
+# Segment streaming
+# -------------------------------------------------------------------
+
+
+def test_chunk_segments_single_segment_matches_chunk(multi_paragraph_doc):
+    chunker = FixedTokenChunker(chunk_size=12, overlap=4)
+    expected = [c.content for c in chunker.chunk(multi_paragraph_doc)]
+    streamed = chunker.chunk_segments(
+        multi_paragraph_doc, iter([multi_paragraph_doc.content])
+    )
+    assert [c.content for c in streamed] == expected
+    assert [c.index for c in streamed] == list(range(len(expected)))
+
+
+def test_chunk_segments_windows_span_segment_boundaries():
+    chunker = FixedTokenChunker(chunk_size=8, overlap=2)
+    pages = [" ".join(f"p{p}w{i}" for i in range(7)) + "\n\n" for p in range(5)]
+    doc = Document(content="", type="text", metadata={"file_type": ".pdf"})
+
+    chunks = chunker.chunk_segments(doc, (page for page in pages))
+
+    assert len(chunks) >= 2
+    assert all(chunker.tokenizer.count(c.content) <= 8 for c in chunks)
+    assert all(c.metadata == {"file_type": ".pdf"} for c in chunks)
+    assert "p0w0" in chunks[0].content
+    assert "p4w6" in chunks[-1].content
+
+
+def test_chunk_segments_skips_empty_segments():
+    chunker = FixedTokenChunker(chunk_size=8, overlap=2)
+    doc = Document(content="", type="text")
+    assert chunker.chunk_segments(doc, ["", ""]) == []
+
+
+class _CharTokenizer:
+    """One token per character, so expected windows are plain slices."""
+
+    def encode(self, text: str) -> list[int]:
+        return [ord(ch) for ch in text]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(map(chr, tokens))
+
+    def count(self, text: str) -> int:
+        return len(text)
+
+
+@pytest.mark.parametrize("segment_size", [1, 7, 50, 5000])
+def test_windows_match_direct_slicing_for_any_segmentation(segment_size):
+    chunker = FixedTokenChunker(chunk_size=40, overlap=15, tokenizer=_CharTokenizer())
+    text = "".join(chr(ord("a") + i % 26) for i in range(2003))
+    expected = [text[i : i + 40] for i in range(0, len(text) - 15, 25)]
+    segments = [text[i : i + segment_size] for i in range(0, len(text), segment_size)]
+    doc = Document(content=text, type="text")
+
+    streamed = chunker.chunk_segments(doc, segments)
+
+    assert [c.content for c in streamed] == expected
+    assert [c.content for c in chunker.chunk(doc)] == expected
+
+
 # -------------------------------------------------------------------
 # Async: achunk parity
 # -------------------------------------------------------------------
@@ -25,6 +25,24 @@ def test_semantic_chunker_subclass_chunker_abc():
     assert isinstance(SemanticChunker(embedder=_FakeEmbedder()), Chunker)
 
 
+def test_chunking_package_defers_semantic_import():
+    """The chunking package must not import scikit-learn eagerly; the
+    semantic chunker is resolved through the package ``__getattr__``."""
+    import ast
+    import inspect
+
+    import railtracks.retrieval.chunking as chunking
+
+    tree = ast.parse(inspect.getsource(chunking))
+    eager = [
+        node.module
+        for node in tree.body
+        if isinstance(node, ast.ImportFrom) and node.module
+    ]
+    assert "semantic_chunker" not in eager
+    assert chunking.SemanticChunker is SemanticChunker
+
+
 def test_empty_document_returns_empty_list(empty_doc):
     assert SemanticChunker(embedder=_FakeEmbedder()).chunk(empty_doc) == []
 
@@ -35,6 +35,32 @@ async def test_aembed_returns_text_embeddings():
     assert result.vectors == [[0.1, 0.2], [0.3, 0.4]]
 
 
+@pytest.mark.asyncio
+async def test_aembed_reuses_list_vectors_and_converts_others():
+    as_list = [0.1, 0.2]
+    as_tuple = (0.3, 0.4)
+    fake = _fake_response([as_list, as_tuple])  # type: ignore[list-item]
+    with patch("litellm.aembedding", new=AsyncMock(return_value=fake)):
+        emb = LiteLLMEmbedding(model="openai/text-embedding-3-small")
+        result = await emb.aembed(["a", "b"])
+
+    assert result.vectors[0] is as_list
+    assert result.vectors[1] == [0.3, 0.4]
+    assert type(result.vectors[1]) is list
+
+
+@pytest.mark.asyncio
+async def test_aembed_reads_dict_shaped_data():
+    fake = _fake_response([])
+    fake.data = [{"embedding": [0.1, 0.2]}, {"embedding": [0.3, 0.4]}]
+    with patch("litellm.aembedding", new=AsyncMock(return_value=fake)):
+        emb = LiteLLMEmbedding(model="openai/text-embedding-3-small")
+        result = await emb.aembed(["a", "b"])
+
+    assert result.vectors == [[0.1, 0.2], [0.3, 0.4]]
+    assert result.metrics.dimension == 2
+
+
 @pytest.mark.asyncio
 async def test_aembed_empty_returns_empty():
     emb = LiteLLMEmbedding(model="openai/text-embedding-3-small")
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import pytest
+from railtracks.retrieval.embedding import (
+    CachedEmbedding,
+    Embedding,
+    EmbeddingMetrics,
+    TextEmbeddings,
+)
+
+
+class _CountingEmbedder(Embedding):
+    default_batch_size = 8
+
+    def __init__(self, model: str = "stub") -> None:
+        self.model = model
+        self.calls: list[list[str]] = []
+
+    async def aembed(self, texts: list[str]) -> TextEmbeddings:
+        self.calls.append(list(texts))
+        return TextEmbeddings(
+            vectors=[[float(len(t)), float(self.model == "other")] for t in texts],
+            metrics=EmbeddingMetrics(
+                input_tokens=len(texts), model=self.model, dimension=2
+            ),
+        )
+
+
+@pytest.mark.asyncio
+async def test_only_misses_reach_the_wrapped_embedder():
+    inner = _CountingEmbedder()
+    cached = CachedEmbedding(inner)
+
+    await cached.aembed(["a", "bb"])
+    result = await cached.aembed(["bb", "ccc", "a"])
+
+    assert inner.calls == [["a", "bb"], ["ccc"]]
+    assert result.vectors == [[2.0, 0.0], [3.0, 0.0], [1.0, 0.0]]
+    assert result.metrics.vector_count == 3
+    assert result.metrics.input_tokens == 1
+    assert result.metrics.model == "stub"
+
+
+@pytest.mark.asyncio
+async def test_full_hit_makes_no_call():
+    inner = _CountingEmbedder()
+    cached = CachedEmbedding(inner)
+    await cached.aembed(["a"])
+
+    result = await cached.aembed(["a"])
+
+    assert len(inner.calls) == 1
+    assert result.metrics.model == "stub"
+    assert result.metrics.dimension == 2
+
+
+@pytest.mark.asyncio
+async def test_repeats_within_a_call_are_embedded_once():
+    inner = _CountingEmbedder()
+    cached = CachedEmbedding(inner)
+
+    result = await cached.aembed(["x", "x", "yy"])
+
+    assert inner.calls == [["x", "yy"]]
+    assert result.vectors == [[1.0, 0.0], [1.0, 0.0], [2.0, 0.0]]
+
+
+@pytest.mark.asyncio
+async def test_returned_vectors_do_not_alias_the_cache():
+    cached = CachedEmbedding(_CountingEmbedder())
+    first = await cached.aembed(["a"])
+    first.vectors[0][0] = 99.0
+
+    again = await cached.aembed(["a"])
+
+    assert again.vectors[0] == [1.0, 0.0]
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entry_is_evicted():
+    inner = _CountingEmbedder()
+    cached = CachedEmbedding(inner, max_size=2)
+    await cached.aembed(["a", "bb"])
+    await cached.aembed(["a"])  # refresh "a"
+    await cached.aembed(["ccc"])  # evicts "bb"
+
+    await cached.aembed(["a", "bb"])
+
+    assert inner.calls[-1] == ["bb"]
+
+
+@pytest.mark.asyncio
+async def test_model_change_drops_cached_vectors():
+    inner = _CountingEmbedder()
+    cached = CachedEmbedding(inner)
+    await cached.aembed(["a"])
+
+    inner.model = "other"
+    result = await cached.aembed(["a", "bb"])
+
+    assert inner.calls[-1] == ["a", "bb"]
+    assert result.vectors == [[1.0, 1.0], [2.0, 1.0]]
+    assert result.metrics.model == "other"
+
+
+def test_inherits_batch_size_and_validates_max_size():
+    assert CachedEmbedding(_CountingEmbedder()).default_batch_size == 8
+    with pytest.raises(ValueError, match="max_size"):
+        CachedEmbedding(_CountingEmbedder(), max_size=0)
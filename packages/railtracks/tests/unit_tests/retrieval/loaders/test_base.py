@@ -1,7 +1,7 @@
 from collections.abc import AsyncGenerator
 
 import pytest
-from railtracks.retrieval.loaders.base import BaseDocumentLoader
+from railtracks.retrieval.loaders.base import BaseDocumentLoader, _find_files
 from railtracks.retrieval.models import Document, DocumentType
 
 
@@ -94,3 +94,23 @@ async def test_load_works_from_running_event_loop(self):
         loader = ConcreteLoader(docs)
         result = loader.load()
         assert result == docs
+
+
+class TestFindFiles:
+    """Tests for the shared directory-walk helper used by file loaders."""
+
+    def test_matches_suffixes_case_insensitively_in_sorted_order(self, tmp_path):
+        """Matching files at any depth are returned sorted; others are skipped."""
+        (tmp_path / "b.json").write_text("{}", encoding="utf-8")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "a.JSONL").write_text("", encoding="utf-8")
+        (tmp_path / "notes.txt").write_text("x", encoding="utf-8")
+        (tmp_path / "dir.json").mkdir()
+
+        found = _find_files(tmp_path, {".json", ".jsonl"})
+
+        assert found == [tmp_path / "b.json", tmp_path / "nested" / "a.JSONL"]
+
+    def test_empty_directory_returns_empty_list(self, tmp_path):
+        """A directory with no matching files yields an empty list."""
+        assert _find_files(tmp_path, {".pdf"}) == []
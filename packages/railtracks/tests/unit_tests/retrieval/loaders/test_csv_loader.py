@@ -147,6 +147,14 @@ async def test_directory_sorted_order(self, csv_dir):
         assert "v1" in docs[0].content
         assert "v3" in docs[1].content
 
+    async def test_directory_matches_upper_case_extensions(self, tmp_path):
+        """Directory scans match `.CSV` as well as `.csv`."""
+        (tmp_path / "a.csv").write_text("col\nlower\n", encoding="utf-8")
+        (tmp_path / "b.CSV").write_text("col\nupper\n", encoding="utf-8")
+        docs = await CSVLoader(str(tmp_path)).aload()
+        assert len(docs) == 2
+        assert "upper" in docs[1].content
+
     async def test_empty_directory_returns_empty_list(self, tmp_path):
         """An empty directory yields no documents."""
         docs = await CSVLoader(str(tmp_path)).aload()
@@ -1,7 +1,9 @@
+import asyncio
+import os
 from unittest.mock import MagicMock, patch
 
 import pytest
-from railtracks.retrieval.loaders.pdf_loader import PyPDFLoader
+from railtracks.retrieval.loaders.pdf_loader import PyPDFLoader, _extract_all_pages
 from railtracks.retrieval.models import DocumentType
 
 
@@ -161,6 +163,28 @@ async def test_no_page_key_in_metadata(self, tmp_path):
             docs = await PyPDFLoader(str(pdf), breakdown_strategy="document").aload()
         assert "page" not in docs[0].metadata
 
+    async def test_extracts_whole_pdf_in_one_thread_hop(self, tmp_path):
+        """The 'document' strategy parses and extracts every page in one worker call."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        reader = _make_reader(["a", "b", "c"])
+        real_to_thread = asyncio.to_thread
+        calls = []
+
+        async def counting_to_thread(func, *args, **kwargs):
+            calls.append(func)
+            return await real_to_thread(func, *args, **kwargs)
+
+        with (
+            patch("railtracks.retrieval.loaders.pdf_loader.PdfReader", return_value=reader),
+            patch("asyncio.to_thread", side_effect=counting_to_thread),
+        ):
+            docs = await PyPDFLoader(str(pdf), breakdown_strategy="document").aload()
+
+        assert docs[0].content == "a\n\nb\n\nc"
+        assert calls.count(_extract_all_pages) == 1
+        assert not any(page.extract_text in calls for page in reader.pages)
+
 
 class TestPyPDFLoaderDirectory:
     """Tests for PyPDFLoader loading a directory."""
@@ -174,6 +198,15 @@ async def test_directory_loads_all_pdf_files(self, tmp_path):
             docs = await PyPDFLoader(str(tmp_path), breakdown_strategy="document").aload()
         assert len(docs) == 2
 
+    async def test_directory_matches_upper_case_extensions(self, tmp_path):
+        """Directory scans match `.PDF` as well as `.pdf`."""
+        (tmp_path / "a.pdf").touch()
+        (tmp_path / "b.PDF").touch()
+        reader = _make_reader(["content"])
+        with patch("railtracks.retrieval.loaders.pdf_loader.PdfReader", return_value=reader):
+            docs = await PyPDFLoader(str(tmp_path), breakdown_strategy="document").aload()
+        assert [d.source for d in docs] == [str(tmp_path / "a.pdf"), str(tmp_path / "b.PDF")]
+
     async def test_empty_directory_returns_empty_list(self, tmp_path):
         """An empty directory yields no documents."""
         docs = await PyPDFLoader(str(tmp_path)).aload()
@@ -187,3 +220,154 @@ async def test_directory_ignores_non_pdf_files(self, tmp_path):
         with patch("railtracks.retrieval.loaders.pdf_loader.PdfReader", return_value=reader):
             docs = await PyPDFLoader(str(tmp_path), breakdown_strategy="document").aload()
         assert len(docs) == 1
+
+
+class TestPyPDFLoaderCache:
+    """Tests for the on-disk page text cache."""
+
+    async def test_cache_hit_skips_parsing(self, tmp_path):
+        """A second load of an unchanged PDF is served from the cache."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        cache = tmp_path / "cache"
+        reader = _make_reader(["first", "", "third"])
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader", return_value=reader
+        ) as mock_reader:
+            first = await PyPDFLoader(str(pdf), cache_dir=str(cache)).aload()
+            second = await PyPDFLoader(str(pdf), cache_dir=str(cache)).aload()
+        assert mock_reader.call_count == 1
+        assert [d.content for d in second] == [d.content for d in first]
+        assert [d.metadata for d in second] == [d.metadata for d in first]
+
+    async def test_cache_is_shared_across_strategies(self, tmp_path):
+        """Cached page texts serve both breakdown strategies."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        cache = tmp_path / "cache"
+        reader = _make_reader(["first", "second"])
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader", return_value=reader
+        ) as mock_reader:
+            await PyPDFLoader(str(pdf), cache_dir=str(cache)).aload()
+            docs = await PyPDFLoader(
+                str(pdf), breakdown_strategy="document", cache_dir=str(cache)
+            ).aload()
+        assert mock_reader.call_count == 1
+        assert docs[0].content == "first\n\nsecond"
+        assert docs[0].metadata["total_pages"] == 2
+
+    async def test_modified_file_is_reparsed(self, tmp_path):
+        """Changing the file invalidates its cache entry."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        cache = tmp_path / "cache"
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            return_value=_make_reader(["old"]),
+        ):
+            await PyPDFLoader(str(pdf), cache_dir=str(cache)).aload()
+        pdf.write_bytes(b"changed")
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            return_value=_make_reader(["new"]),
+        ):
+            docs = await PyPDFLoader(str(pdf), cache_dir=str(cache)).aload()
+        assert docs[0].content == "new"
+
+    async def test_cache_dir_from_environment(self, tmp_path, monkeypatch):
+        """RAILTRACKS_MEDIA_CACHE enables the cache when no cache_dir is given."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        cache = tmp_path / "cache"
+        monkeypatch.setenv("RAILTRACKS_MEDIA_CACHE", str(cache))
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            return_value=_make_reader(["content"]),
+        ):
+            await PyPDFLoader(str(pdf)).aload()
+        assert len(list(cache.glob("*.json"))) == 1
+
+    async def test_no_cache_by_default(self, tmp_path, monkeypatch):
+        """Without cache_dir or the environment variable nothing is cached."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        monkeypatch.delenv("RAILTRACKS_MEDIA_CACHE", raising=False)
+        loader = PyPDFLoader(str(pdf))
+        assert loader._cache_file(pdf) is None
+
+    async def test_corrupt_cache_entry_is_ignored(self, tmp_path):
+        """An unreadable cache entry falls back to parsing the PDF."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        loader = PyPDFLoader(str(pdf), cache_dir=str(tmp_path / "cache"))
+        cache_file = loader._cache_file(pdf)
+        cache_file.parent.mkdir()
+        cache_file.write_text("{not json", encoding="utf-8")
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            return_value=_make_reader(["content"]),
+        ):
+            docs = await loader.aload()
+        assert docs[0].content == "content"
+
+    async def test_unwritable_cache_dir_does_not_fail_the_load(self, tmp_path):
+        """A cache directory that cannot be created is skipped, not raised."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        blocker = tmp_path / "cache"
+        blocker.write_text("not a directory", encoding="utf-8")
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            return_value=_make_reader(["content"]),
+        ):
+            docs = await PyPDFLoader(str(pdf), cache_dir=str(blocker)).aload()
+        assert docs[0].content == "content"
+
+    async def test_concurrent_loads_of_one_pdf_share_no_temp_file(self, tmp_path):
+        """Concurrent loads of the same PDF use separate temp files."""
+        pdf = tmp_path / "doc.pdf"
+        pdf.touch()
+        cache = tmp_path / "cache"
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            side_effect=lambda _: _make_reader(["first", "second"]),
+        ):
+            loaders = [PyPDFLoader(str(pdf), cache_dir=str(cache)) for _ in range(4)]
+            results = await asyncio.gather(*(loader.aload() for loader in loaders))
+        assert all([d.content for d in docs] == ["first", "second"] for docs in results)
+        assert [p.name for p in cache.iterdir() if p.suffix == ".tmp"] == []
+        assert len(list(cache.glob("*.json"))) == 1
+
+    async def test_cache_evicts_least_recently_used_entries(self, tmp_path):
+        """Writes beyond cache_max_entries drop the least recently used entry."""
+        cache = tmp_path / "cache"
+        pdfs = []
+        for name in ("a", "b", "c"):
+            pdf = tmp_path / f"{name}.pdf"
+            pdf.write_bytes(name.encode())
+            pdfs.append(pdf)
+        a, b, c = pdfs
+        with patch(
+            "railtracks.retrieval.loaders.pdf_loader.PdfReader",
+            side_effect=lambda _: _make_reader(["content"]),
+        ) as mock_reader:
+            await PyPDFLoader(str(a), cache_dir=str(cache), cache_max_entries=2).aload()
+            await PyPDFLoader(str(b), cache_dir=str(cache), cache_max_entries=2).aload()
+            loader = PyPDFLoader(str(a), cache_dir=str(cache), cache_max_entries=2)
+            a_entry = loader._cache_file(a)
+            b_entry = loader._cache_file(b)
+            os.utime(a_entry, (1_000, 1_000))
+            os.utime(b_entry, (2_000, 2_000))
+            # Reading `a` marks it as the most recently used entry.
+            await loader.aload()
+            await PyPDFLoader(str(c), cache_dir=str(cache), cache_max_entries=2).aload()
+        assert mock_reader.call_count == 3
+        assert a_entry.exists()
+        assert not b_entry.exists()
+        assert len(list(cache.glob("*.json"))) == 2
+
+    def test_invalid_cache_max_entries_raises_value_error(self, tmp_path):
+        """cache_max_entries below 1 is rejected at construction."""
+        with pytest.raises(ValueError, match="cache_max_entries"):
+            PyPDFLoader(str(tmp_path / "x.pdf"), cache_max_entries=0)
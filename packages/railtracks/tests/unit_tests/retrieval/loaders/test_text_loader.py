@@ -1,4 +1,8 @@
+import threading
+from unittest.mock import patch
+
 import pytest
+from railtracks.retrieval.loaders.base import _find_files
 from railtracks.retrieval.loaders.text_loader import TextLoader
 from railtracks.retrieval.models import DocumentType
 
@@ -98,6 +102,20 @@ async def test_directory_recurses_into_subfolders(self, tmp_path):
         assert any(str(sub_a / "B.txt") in s for s in sources)
         assert any(str(deep / "C.md") in s for s in sources)
 
+    async def test_directory_walk_runs_off_the_event_loop(self, text_dir):
+        """The directory walk happens in a worker thread, not on the loop."""
+        walk_threads = []
+
+        def _spy(root, suffixes):
+            walk_threads.append(threading.current_thread())
+            return _find_files(root, suffixes)
+
+        with patch("railtracks.retrieval.loaders.text_loader._find_files", _spy):
+            docs = await TextLoader(str(text_dir)).aload()
+
+        assert len(docs) == 3
+        assert walk_threads and walk_threads[0] is not threading.main_thread()
+
 
 class TestTextLoaderErrors:
     """Tests for error conditions in TextLoader."""
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import builtins
+import threading
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
+import numpy as np
 import pytest
 from railtracks.retrieval.stores.models import (
     StoreEntry,
@@ -13,9 +16,11 @@
     StoreScope,
 )
 from railtracks.retrieval.stores.vector.backends.chroma import (
+    _CHROMA_SCORE,
     ChromaBackend,
     ChromaCloudBackend,
     _chroma_to_score,
+    _iter_pages,
     _to_chroma_where,
 )
 from railtracks.retrieval.stores.vector.base import VectorStore
@@ -182,6 +187,24 @@ async def test_initialize_uses_http_client_when_host_port_given():
     mock_chroma.HttpClient.assert_called_once_with(host="localhost", port=8000)
 
 
+async def test_http_backends_share_a_client_per_endpoint():
+    mock_chroma = MagicMock()
+
+    with patch.dict("sys.modules", {"chromadb": mock_chroma}):
+        await ChromaBackend.create("a", host="localhost", port=8000)
+        await ChromaBackend.create("b", host="localhost", port=8000)
+        await ChromaBackend.create("c", host="localhost", port=8001)
+
+    assert mock_chroma.HttpClient.call_count == 2
+    client = mock_chroma.HttpClient.return_value
+    client.get_or_create_collection.assert_any_call(
+        "a", metadata={"hnsw:space": "cosine"}
+    )
+    client.get_or_create_collection.assert_any_call(
+        "b", metadata={"hnsw:space": "cosine"}
+    )
+
+
 # ---------------------------------------------------------------------------
 # upsert
 # ---------------------------------------------------------------------------
@@ -215,6 +238,99 @@ async def test_upsert_passes_documents_when_content_in_payload():
     )
 
 
+async def test_upsert_many_sends_single_request():
+    col = _make_collection()
+    backend = _injected_backend(col)
+
+    await backend.upsert_many(
+        [
+            ("a", [0.1, 0.2], {"content": "first"}),
+            ("b", [0.3, 0.4], {"content": "second"}),
+        ]
+    )
+
+    col.upsert.assert_called_once()
+    kwargs = col.upsert.call_args.kwargs
+    assert kwargs["ids"] == ["a", "b"]
+    assert kwargs["documents"] == ["first", "second"]
+    assert kwargs["metadatas"] == [{"content": "first"}, {"content": "second"}]
+    embeddings = kwargs["embeddings"]
+    assert isinstance(embeddings, np.ndarray)
+    assert embeddings.dtype == np.float32
+    np.testing.assert_allclose(embeddings, [[0.1, 0.2], [0.3, 0.4]], rtol=1e-6)
+
+
+async def test_upsert_many_single_item_takes_single_upsert_path():
+    col = _make_collection()
+    backend = _injected_backend(col)
+
+    await backend.upsert_many([("a", [0.1, 0.2], {"content": "first"})])
+
+    col.upsert.assert_called_once_with(
+        ids=["a"],
+        embeddings=[[0.1, 0.2]],
+        documents=["first"],
+        metadatas=[{"content": "first"}],
+    )
+
+
+async def test_upsert_many_splits_large_batches():
+    col = _make_collection()
+    backend = _injected_backend(col)
+    items = [(str(i), [float(i)], {"content": str(i)}) for i in range(650)]
+
+    await backend.upsert_many(items)
+
+    sizes = sorted(len(c.kwargs["ids"]) for c in col.upsert.call_args_list)
+    assert sizes == [50, 300, 300]
+    written = {id_ for c in col.upsert.call_args_list for id_ in c.kwargs["ids"]}
+    assert written == {str(i) for i in range(650)}
+
+
+async def test_upsert_many_keeps_documents_when_some_items_have_no_content():
+    col = _make_collection()
+    backend = _injected_backend(col)
+
+    await backend.upsert_many(
+        [
+            ("a", [0.1], {"content": "first"}),
+            ("b", [0.2], {"k": "no content"}),
+            ("c", [0.3], {"content": "third"}),
+        ]
+    )
+
+    calls = {tuple(c.kwargs["ids"]): c.kwargs for c in col.upsert.call_args_list}
+    assert calls[("a", "c")]["documents"] == ["first", "third"]
+    assert calls[("b",)]["documents"] is None
+
+
+async def test_upsert_many_keeps_last_duplicate_across_slices():
+    col = _make_collection()
+    backend = _injected_backend(col)
+    items = [(str(i), [float(i)], {"content": str(i)}) for i in range(400)]
+    items.append(("0", [9.0], {"content": "latest"}))
+
+    await backend.upsert_many(items)
+
+    written = [
+        (id_, doc)
+        for c in col.upsert.call_args_list
+        for id_, doc in zip(c.kwargs["ids"], c.kwargs["documents"])
+    ]
+    assert len(written) == 400
+    assert ("0", "latest") in written
+    assert ("0", "0") not in written
+
+
+async def test_upsert_many_empty_is_noop():
+    col = _make_collection()
+    backend = _injected_backend(col)
+
+    await backend.upsert_many([])
+
+    col.upsert.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # search
 # ---------------------------------------------------------------------------
@@ -293,6 +409,10 @@ def test_chroma_to_score_ip():
     assert _chroma_to_score(DistanceMetric.IP, 0.3) == pytest.approx(0.7)
 
 
+def test_chroma_score_table_covers_every_metric():
+    assert set(_CHROMA_SCORE) == set(DistanceMetric)
+
+
 async def test_search_passes_no_where_when_filters_empty():
     col = _make_collection(count=1)
     col.query.return_value = {"ids": [["a"]], "distances": [[0.0]], "metadatas": [[{}]]}
@@ -318,6 +438,25 @@ async def test_delete_calls_collection_delete_with_id():
     col.delete.assert_called_once_with(ids=["entry-1"])
 
 
+async def test_delete_many_splits_at_the_write_cap():
+    col = _make_collection()
+    backend = _injected_backend(col)
+
+    await backend.delete_many([str(i) for i in range(350)])
+
+    sizes = sorted(len(c.kwargs["ids"]) for c in col.delete.call_args_list)
+    assert sizes == [50, 300]
+
+
+async def test_delete_many_empty_is_noop():
+    col = _make_collection()
+    backend = _injected_backend(col)
+
+    await backend.delete_many([])
+
+    col.delete.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # delete_where
 # ---------------------------------------------------------------------------
@@ -503,6 +642,17 @@ async def test_cloud_initialize_does_not_call_ephemeral_or_http_client():
     mock_chroma.PersistentClient.assert_not_called()
 
 
+async def test_cloud_backends_share_a_client_per_credentials():
+    mock_chroma = MagicMock()
+
+    with patch.dict("sys.modules", {"chromadb": mock_chroma}):
+        await ChromaCloudBackend.create("a", api_key="k", tenant="t", database="d")
+        await ChromaCloudBackend.create("b", api_key="k", tenant="t", database="d")
+        await ChromaCloudBackend.create("c", api_key="k", tenant="t", database="e")
+
+    assert mock_chroma.CloudClient.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # ChromaCloudBackend — create() factory
 # ---------------------------------------------------------------------------
@@ -588,9 +738,110 @@ async def test_filtered_count_pages_to_exhaustion():
     assert all(c.kwargs["include"] == [] for c in collection.get.call_args_list)
 
 
+def test_iter_pages_fetches_lazily():
+    collection = _paging_collection(total=1000)
+
+    pages = _iter_pages(collection, None, None, [])
+    first = next(pages)
+
+    assert len(first["ids"]) == 300
+    assert collection.get.call_count == 1
+
+
 async def test_unfiltered_count_uses_collection_count():
     collection = _make_collection(count=42)
     backend = _injected_backend(collection)
 
     assert await backend.count({}) == 42
     collection.get.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# count_ttl — cached unfiltered count
+# ---------------------------------------------------------------------------
+
+
+def _ttl_backend(collection: MagicMock, ttl: float = 60.0) -> ChromaBackend:
+    backend = ChromaBackend("test", count_ttl=ttl)
+    backend._collection = collection
+    return backend
+
+
+async def test_count_is_not_cached_by_default():
+    collection = _make_collection(count=5)
+    backend = _injected_backend(collection)
+
+    await backend.count({})
+    await backend.count({})
+
+    assert collection.count.call_count == 2
+
+
+async def test_count_ttl_reuses_count_across_count_and_search():
+    collection = _make_collection(count=5)
+    collection.query.return_value = {"ids": [[]], "distances": [[]], "metadatas": [[]]}
+    backend = _ttl_backend(collection)
+
+    assert await backend.count({}) == 5
+    await backend.search([1.0, 0.0], 3, {})
+    assert await backend.count({}) == 5
+
+    assert collection.count.call_count == 1
+
+
+async def test_count_ttl_invalidated_by_writes_and_deletes():
+    collection = _make_collection(count=5)
+    backend = _ttl_backend(collection)
+
+    await backend.count({})
+    await backend.upsert("a", [0.1], {"content": "x"})
+    collection.count.return_value = 6
+    assert await backend.count({}) == 6
+
+    await backend.delete("a")
+    collection.count.return_value = 5
+    assert await backend.count({}) == 5
+
+    await backend.delete_where({"k": "v"})
+    collection.count.return_value = 0
+    assert await backend.count({}) == 0
+
+
+async def test_count_ttl_search_overlapping_a_write_does_not_recache_stale_count():
+    collection = _make_collection(count=0)
+    collection.query.return_value = {"ids": [[]], "distances": [[]], "metadatas": [[]]}
+    started, release = threading.Event(), threading.Event()
+
+    def slow_upsert(**_kwargs):
+        started.set()
+        release.wait(5)
+        collection.count.return_value = 1
+
+    collection.upsert.side_effect = slow_upsert
+    backend = _ttl_backend(collection)
+
+    write = asyncio.create_task(backend.upsert("a", [0.1], {"content": "x"}))
+    await asyncio.to_thread(started.wait, 5)
+    assert await backend.search([0.1], 3, {}) == []
+    release.set()
+    await write
+
+    assert await backend.count({}) == 1
+
+
+async def test_count_ttl_expires(monkeypatch):
+    import railtracks.retrieval.stores.vector.backends.chroma as chroma_module
+
+    now = [100.0]
+    monkeypatch.setattr(chroma_module.time, "monotonic", lambda: now[0])
+    collection = _make_collection(count=5)
+    backend = _ttl_backend(collection, ttl=2.0)
+
+    await backend.count({})
+    now[0] += 1.0
+    await backend.count({})
+    assert collection.count.call_count == 1
+
+    now[0] += 2.0
+    await backend.count({})
+    assert collection.count.call_count == 2
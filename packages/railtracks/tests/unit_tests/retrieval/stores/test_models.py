@@ -156,3 +156,10 @@ def test_retrieved_store_entry():
     assert retrieved.rank == 0
     assert retrieved.source_retriever == "dense"
     assert retrieved.rerank_score is None
+
+
+def test_retrieved_store_entry_is_slotted():
+    retrieved = RetrievedStoreEntry(_make_entry(), 0.5, 1, "dense")
+    assert not hasattr(retrieved, "__dict__")
+    assert not hasattr(retrieved.entry, "__dict__")
+    assert (retrieved.rank, retrieved.source_retriever) == (1, "dense")
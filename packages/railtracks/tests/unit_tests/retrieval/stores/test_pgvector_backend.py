@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import gc
 import json
+import weakref
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
@@ -14,6 +17,8 @@
     StoreScope,
 )
 from railtracks.retrieval.stores.vector.backends.pgvector import (
+    _PG_OPERATOR,
+    _PG_SCORE,
     PgvectorBackend,
     _build_where,
     _pg_to_score,
@@ -187,6 +192,25 @@ async def test_initialize_creates_extension_and_table():
     assert backend._pool is pool
 
 
+async def test_initialize_issues_schema_setup_in_one_round_trip():
+    conn, pool = _make_pool()
+    mock_asyncpg = MagicMock()
+    mock_asyncpg.create_pool = AsyncMock(return_value=pool)
+    mock_pgvector_asyncpg = MagicMock()
+    mock_pgvector_asyncpg.register_vector = AsyncMock()
+
+    with patch.dict(
+        "sys.modules",
+        {"asyncpg": mock_asyncpg, "pgvector.asyncpg": mock_pgvector_asyncpg},
+    ):
+        backend = PgvectorBackend("postgresql://test/test", table="one_trip")
+        await backend.initialize()
+
+    conn.execute.assert_called_once()
+    sql = conn.execute.call_args.args[0]
+    assert sql.index("CREATE EXTENSION") < sql.index("CREATE TABLE")
+
+
 async def test_initialize_uses_dim_in_vector_type():
     conn, pool = _make_pool()
     mock_asyncpg = MagicMock()
@@ -232,6 +256,51 @@ async def test_initialize_uses_untyped_vector_without_dim():
     assert "vector" in create_table_sql
 
 
+async def test_backends_on_same_dsn_share_a_pool():
+    _conn, pool = _make_pool()
+    mock_asyncpg = MagicMock()
+    mock_asyncpg.create_pool = AsyncMock(return_value=pool)
+    mock_pgvector_asyncpg = MagicMock()
+    mock_pgvector_asyncpg.register_vector = AsyncMock()
+
+    with patch.dict(
+        "sys.modules",
+        {"asyncpg": mock_asyncpg, "pgvector.asyncpg": mock_pgvector_asyncpg},
+    ):
+        a = await PgvectorBackend.create("postgresql://shared/db", table="a")
+        b = await PgvectorBackend.create("postgresql://shared/db", table="b")
+        await PgvectorBackend.create("postgresql://other/db", table="a")
+
+    assert a._pool is b._pool is pool
+    assert mock_asyncpg.create_pool.await_count == 2
+
+
+def test_shared_pool_cache_does_not_keep_closed_loops_alive():
+    async def _create_pool(*_args, **_kwargs):
+        _conn, pool = _make_pool()
+        # Real asyncpg pools hold their loop, which is what pinned it before.
+        pool.loop = asyncio.get_running_loop()
+        return pool
+
+    mock_asyncpg = MagicMock()
+    mock_asyncpg.create_pool = _create_pool
+    mock_pgvector_asyncpg = MagicMock()
+    mock_pgvector_asyncpg.register_vector = AsyncMock()
+
+    async def _use_backend() -> weakref.ref:
+        await PgvectorBackend.create("postgresql://loops/db", table="t")
+        return weakref.ref(asyncio.get_running_loop())
+
+    with patch.dict(
+        "sys.modules",
+        {"asyncpg": mock_asyncpg, "pgvector.asyncpg": mock_pgvector_asyncpg},
+    ):
+        loops = [asyncio.run(_use_backend()) for _ in range(3)]
+    gc.collect()
+
+    assert [ref() for ref in loops] == [None, None, None]
+
+
 # ---------------------------------------------------------------------------
 # upsert
 # ---------------------------------------------------------------------------
@@ -250,6 +319,91 @@ async def test_upsert_passes_correct_args():
     assert json.loads(payload_arg) == {"scope_user_id": "alice"}
 
 
+async def test_upsert_many_uses_executemany():
+    conn, pool = _make_pool()
+    backend = _injected_backend(pool)
+
+    await backend.upsert_many(
+        [("a", [0.1], {"k": "v1"}), ("b", [0.2], {"k": "v2"})]
+    )
+
+    conn.executemany.assert_called_once()
+    sql, rows = conn.executemany.call_args.args
+    assert "ON CONFLICT" in sql
+    assert [(r[0], r[1], json.loads(r[2])) for r in rows] == [
+        ("a", [0.1], {"k": "v1"}),
+        ("b", [0.2], {"k": "v2"}),
+    ]
+    conn.execute.assert_not_called()
+
+
+async def test_upsert_many_splits_at_write_batch_size():
+    conn, pool = _make_pool()
+    backend = PgvectorBackend("postgresql://localhost/test", write_batch_size=2)
+    backend._pool = pool
+    items = [(str(i), [float(i)], {"i": i}) for i in range(5)]
+
+    await backend.upsert_many(items)
+
+    batches = [c.args[1] for c in conn.executemany.call_args_list]
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert [row[0] for b in batches for row in b] == ["0", "1", "2", "3", "4"]
+
+
+async def test_upsert_many_writes_slices_concurrently():
+    conn, pool = _make_pool()
+    in_flight = 0
+    peak = 0
+
+    async def _executemany(sql, rows):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+
+    conn.executemany = _executemany
+    backend = PgvectorBackend("postgresql://localhost/test", write_batch_size=2)
+    backend._pool = pool
+
+    await backend.upsert_many([(str(i), [float(i)], {}) for i in range(6)])
+
+    assert peak == 3
+
+
+async def test_upsert_many_keeps_last_duplicate_across_slices():
+    conn, pool = _make_pool()
+    backend = PgvectorBackend("postgresql://localhost/test", write_batch_size=2)
+    backend._pool = pool
+
+    await backend.upsert_many(
+        [("a", [0.1], {"v": 1}), ("b", [0.2], {}), ("a", [0.3], {"v": 2})]
+    )
+
+    rows = [row for c in conn.executemany.call_args_list for row in c.args[1]]
+    assert [(r[0], r[1], json.loads(r[2])) for r in rows] == [
+        ("a", [0.3], {"v": 2}),
+        ("b", [0.2], {}),
+    ]
+
+
+def test_write_batch_size_must_be_positive():
+    with pytest.raises(ValueError, match="write_batch_size"):
+        PgvectorBackend("postgresql://localhost/test", write_batch_size=0)
+
+
+async def test_upsert_many_single_item_uses_execute():
+    conn, pool = _make_pool()
+    backend = _injected_backend(pool)
+
+    await backend.upsert_many([("a", [0.1], {"k": "v1"})])
+
+    conn.executemany.assert_not_called()
+    conn.execute.assert_called_once()
+    _, id_arg, vec_arg, payload_arg = conn.execute.call_args.args
+    assert (id_arg, vec_arg, json.loads(payload_arg)) == ("a", [0.1], {"k": "v1"})
+
+
 async def test_upsert_sql_contains_on_conflict():
     conn, pool = _make_pool()
     backend = _injected_backend(pool)
@@ -383,6 +537,10 @@ def test_pg_to_score_ip():
     assert _pg_to_score(DistanceMetric.IP, -0.3) == pytest.approx(0.3)
 
 
+def test_pg_score_table_covers_every_metric():
+    assert set(_PG_SCORE) == set(_PG_OPERATOR) == set(DistanceMetric)
+
+
 # ---------------------------------------------------------------------------
 # delete
 # ---------------------------------------------------------------------------
@@ -399,6 +557,27 @@ async def test_delete_passes_id():
     assert id_arg == "entry-1"
 
 
+async def test_delete_many_uses_one_statement():
+    conn, pool = _make_pool()
+    backend = _injected_backend(pool)
+
+    await backend.delete_many(["a", "b"])
+
+    sql, ids_arg = conn.execute.call_args.args
+    assert "id = ANY($1::text[])" in sql
+    assert ids_arg == ["a", "b"]
+    conn.execute.assert_called_once()
+
+
+async def test_delete_many_empty_is_noop():
+    conn, pool = _make_pool()
+    backend = _injected_backend(pool)
+
+    await backend.delete_many([])
+
+    conn.execute.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # delete_where
 # ---------------------------------------------------------------------------
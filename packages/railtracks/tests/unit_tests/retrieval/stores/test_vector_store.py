@@ -6,6 +6,7 @@
 from unittest.mock import patch
 from uuid import uuid4
 
+import numpy as np
 import pytest
 from railtracks.retrieval.stores.models import (
     StoreEntry,
@@ -324,6 +325,17 @@ async def test_snapshot_reflects_deletes(tmp_path: Path):
     assert results == []
 
 
+async def test_delete_many_flushes_snapshot_once(tmp_path: Path):
+    backend = InMemoryBackend(snapshot_path=tmp_path / "store.json")
+    await backend.upsert_many([(id, [1.0, 0.0], {}) for id in ("a", "b", "c")])
+
+    with patch.object(backend, "_flush", wraps=backend._flush) as flush:
+        await backend.delete_many(["a", "b", "missing"])
+
+    flush.assert_called_once()
+    assert [id for id, _ in await backend.list_where({}, 10)] == ["c"]
+
+
 async def test_snapshot_no_path_leaves_no_file(tmp_path: Path):
     store = VectorStore(InMemoryBackend())
     await store.write(_make_entry())
@@ -347,3 +359,295 @@ def mock_import(name, *args, **kwargs):
     with patch("builtins.__import__", side_effect=mock_import):
         with pytest.raises(ImportError, match="railtracks\\[stores-vector\\]"):
             await backend.initialize()
+
+
+async def test_chunk_metadata_payload_is_compact_and_roundtrips():
+    import json
+
+    from railtracks.retrieval.stores.vector.base import _entry_to_payload
+
+    entry = _make_entry()
+    entry.chunk_metadata = {"page": 3, "tags": ["a", "b"], "score": 0.5}
+    entry.chunk_offsets = (0, 11)
+
+    payload = _entry_to_payload(entry)
+
+    assert json.loads(payload["chunk_metadata"]) == entry.chunk_metadata
+    assert " " not in payload["chunk_metadata"]
+    assert json.loads(payload["chunk_offsets"]) == [0, 11]
+
+
+def test_json_dumps_is_stdlib_json_with_compact_separators():
+    import json
+    from datetime import datetime
+
+    from railtracks.retrieval.stores.vector import _json
+
+    assert _json.json_dumps({"k": [1, 2]}) == '{"k":[1,2]}'
+    assert _json.json_dumps({"big": 2**70}) == '{"big":%d}' % 2**70
+    assert _json.json_dumps([float("nan")]) == json.dumps([float("nan")])
+    with pytest.raises(TypeError):
+        _json.json_dumps({"at": datetime(2024, 1, 1)})
+
+
+async def test_write_many_roundtrip_flushes_snapshot_once(tmp_path: Path):
+    backend = InMemoryBackend(snapshot_path=tmp_path / "snap.json")
+    store = VectorStore(backend)
+    entries = [_make_entry(content=f"doc {i}") for i in range(3)]
+
+    with patch.object(backend, "_flush", wraps=backend._flush) as flush:
+        ids = await store.write_many(entries)
+
+    assert ids == [str(e.id) for e in entries]
+    assert flush.await_count == 1
+    assert await store.count() == 3
+
+
+async def test_write_many_validates_before_writing():
+    store = VectorStore(InMemoryBackend())
+    entries = [_make_entry(), _make_entry()]
+    entries[1].vector = None
+
+    with pytest.raises(ValueError, match="entry.vector"):
+        await store.write_many(entries)
+    assert await store.count() == 0
+
+
+async def test_write_many_falls_back_to_upsert():
+    class _UpsertOnlyBackend:
+        def __init__(self) -> None:
+            self.upserted: list[str] = []
+
+        async def upsert(self, id, vector, payload) -> None:
+            self.upserted.append(id)
+
+    backend = _UpsertOnlyBackend()
+    entries = [_make_entry(), _make_entry()]
+
+    await VectorStore(backend).write_many(entries)  # type: ignore[arg-type]
+
+    assert backend.upserted == [str(e.id) for e in entries]
+
+
+async def test_in_memory_backend_stores_vectors_as_arrays(tmp_path: Path):
+    path = tmp_path / "store.json"
+    backend = InMemoryBackend(snapshot_path=path)
+    vector = [0.5, 0.25, 0.0]
+    await backend.upsert("a", vector, {})
+    vector[0] = 9.0
+
+    assert isinstance(backend._vectors["a"], np.ndarray)
+    assert backend._vectors["a"].tolist() == [0.5, 0.25, 0.0]
+
+    reloaded = InMemoryBackend(snapshot_path=path)
+    assert isinstance(reloaded._vectors["a"], np.ndarray)
+    assert reloaded._vectors["a"].tolist() == [0.5, 0.25, 0.0]
+
+
+async def test_empty_requests_skip_the_backend():
+    backend = InMemoryBackend()
+    store = VectorStore(backend)
+    with (
+        patch.object(backend, "search") as search,
+        patch.object(backend, "list_where") as list_where,
+        patch.object(backend, "_flush") as flush,
+    ):
+        assert await store.read(_make_query(top_k=0)) == []
+        assert await store.nearest_neighbors([1.0, 0.0, 0.0], k=0) == []
+        assert await store.find({}, limit=0) == []
+        assert await store.write_many([]) == []
+        await backend.upsert_many([])
+
+    search.assert_not_called()
+    list_where.assert_not_called()
+    flush.assert_not_called()
+
+
+async def test_int8_quantization_matches_float_ranking(tmp_path: Path):
+    vectors = {
+        "a": [0.9, 0.1, 0.0],
+        "b": [0.1, 0.9, 0.2],
+        "c": [-0.5, 0.2, 0.8],
+    }
+    exact = InMemoryBackend()
+    path = tmp_path / "q.json"
+    quantized = InMemoryBackend(snapshot_path=path, quantization="int8")
+    for id, vector in vectors.items():
+        await exact.upsert(id, vector, {})
+        await quantized.upsert(id, vector, {})
+
+    assert quantized._vectors["a"].dtype == np.int8
+    query = [1.0, 0.3, 0.1]
+    exact_hits = await exact.search(query, 3, {})
+    quant_hits = await quantized.search(query, 3, {})
+    assert [h[0] for h in quant_hits] == [h[0] for h in exact_hits]
+    for (_, q_score, _), (_, e_score, _) in zip(quant_hits, exact_hits):
+        assert q_score == pytest.approx(e_score, abs=1e-2)
+
+    # The snapshot stays in float form and loads without quantization.
+    reloaded = InMemoryBackend(snapshot_path=path)
+    assert reloaded._vectors["a"].tolist() == pytest.approx(vectors["a"], abs=1e-2)
+
+
+async def test_int8_quantization_drops_nonfinite_vectors():
+    backend = InMemoryBackend(quantization="int8")
+    await backend.upsert("good", [1.0, 0.0], {})
+    await backend.upsert("bad", [float("nan"), 1.0], {})
+
+    hits = await backend.search([1.0, 0.0], 5, {})
+
+    assert [h[0] for h in hits] == ["good"]
+
+
+async def test_int8_batch_quantization_matches_per_vector():
+    items = [
+        ("a", [0.9, -0.1, 0.0], {}),
+        ("b", [0.0, 0.0, 0.0], {}),
+        ("c", [float("inf"), 1.0, 0.0], {}),
+    ]
+    single = InMemoryBackend(quantization="int8")
+    for id, vector, payload in items:
+        await single.upsert(id, vector, payload)
+    batched = InMemoryBackend(quantization="int8")
+    await batched.upsert_many(items)
+
+    for id, _, _ in items:
+        assert batched._vectors[id].tolist() == single._vectors[id].tolist()
+        assert batched._scales[id] == pytest.approx(single._scales[id], nan_ok=True)
+    hits = await batched.search([1.0, 0.0, 0.0], 5, {})
+    assert [h[0] for h in hits] == ["a", "b"]
+
+
+async def test_int8_batch_with_mixed_lengths_falls_back_per_vector():
+    backend = InMemoryBackend(quantization="int8")
+    await backend.upsert_many([("a", [1.0, 0.0], {}), ("b", [0.5], {})])
+
+    assert backend._vectors["a"].tolist() == [127, 0]
+    assert backend._vectors["b"].tolist() == [127]
+
+
+async def test_upsert_does_not_alias_caller_payload():
+    backend = InMemoryBackend()
+    payload = {"k": "v1"}
+    await backend.upsert("a", [1.0, 0.0], payload)
+    payload["k"] = "v2"
+    await backend.upsert_many([("b", [0.0, 1.0], payload)])
+    payload["k"] = "v3"
+
+    listed = dict(await backend.list_where({}, 10))
+
+    assert listed == {"a": {"k": "v1"}, "b": {"k": "v2"}}
+
+
+def test_unknown_quantization_raises():
+    with pytest.raises(ValueError, match="quantization"):
+        InMemoryBackend(quantization="binary")  # type: ignore[arg-type]
+
+
+async def test_unfiltered_search_skips_payload_matching():
+    backend = InMemoryBackend()
+    await backend.upsert("a", [1.0, 0.0], {"k": "v"})
+
+    with patch(
+        "railtracks.retrieval.stores.vector.backends.in_memory._matches_filters"
+    ) as matches:
+        hits = await backend.search([1.0, 0.0], 5, {})
+
+    matches.assert_not_called()
+    assert [h[0] for h in hits] == ["a"]
+
+
+async def test_unfiltered_list_where_skips_payload_matching_and_honours_limit():
+    backend = InMemoryBackend()
+    for id in ("a", "b", "c"):
+        await backend.upsert(id, [1.0, 0.0], {"k": id})
+
+    with patch(
+        "railtracks.retrieval.stores.vector.backends.in_memory._matches_filters"
+    ) as matches:
+        rows = await backend.list_where({}, 2)
+
+    matches.assert_not_called()
+    assert rows == [("a", {"k": "a"}), ("b", {"k": "b"})]
+
+
+@pytest.mark.parametrize("quantization", ["none", "int8"])
+async def test_search_reuses_the_stacked_corpus_until_a_write(quantization):
+    backend = InMemoryBackend(quantization=quantization)
+    await backend.upsert_many(
+        [
+            ("a", [1.0, 0.0], {"k": "x"}),
+            ("b", [0.0, 1.0], {"k": "y"}),
+            ("c", [0.7, 0.7], {"k": "x"}),
+        ]
+    )
+
+    with patch(
+        "railtracks.retrieval.stores.vector.backends.in_memory.np.stack",
+        wraps=np.stack,
+    ) as stack:
+        first = await backend.search([1.0, 0.0], 2, {})
+        filtered = await backend.search([0.0, 1.0], 1, {"k": "x"})
+        assert stack.call_count == 1
+
+        await backend.delete("a")
+        after_delete = await backend.search([1.0, 0.0], 5, {})
+        assert stack.call_count == 2
+
+    assert [hit[0] for hit in first] == ["a", "c"]
+    assert [hit[0] for hit in filtered] == ["c"]
+    assert [hit[0] for hit in after_delete] == ["c", "b"]
+
+
+@pytest.mark.parametrize("quantization", ["none", "int8"])
+async def test_cosine_corpus_is_normalized_without_touching_stored_vectors(
+    quantization,
+):
+    backend = InMemoryBackend(quantization=quantization)
+    await backend.upsert_many(
+        [("a", [30.0, 40.0], {}), ("b", [0.0, 0.5], {}), ("z", [0.0, 0.0], {})]
+    )
+
+    hits = await backend.search([3.0, 4.0], 3, {})
+
+    assert [hit[0] for hit in hits] == ["a", "b", "z"]
+    assert [hit[1] for hit in hits] == pytest.approx([1.0, 0.8, 0.0], abs=1e-2)
+    assert np.allclose(backend._float_vector("a"), [30.0, 40.0], rtol=1e-2)
+
+
+@pytest.mark.parametrize("quantization", ["none", "int8"])
+async def test_binary_prefilter_scores_only_the_hamming_shortlist(quantization):
+    items = [
+        # Exactly nearest the query, but three of its sign bits differ.
+        ("a", [1.0, -0.01, -0.01, -0.01], {"k": "x"}),
+        ("b", [0.5, 0.5, 0.5, 0.5], {"k": "y"}),
+        ("c", [0.6, 0.4, 0.1, 0.1], {"k": "y"}),
+        ("d", [-1.0, -1.0, -1.0, -1.0], {"k": "x"}),
+    ]
+    query = [1.0, 0.01, 0.01, 0.01]
+    exact = InMemoryBackend(quantization=quantization)
+    prefiltered = InMemoryBackend(quantization=quantization, rerank_multiplier=2)
+    await exact.upsert_many(items)
+    await prefiltered.upsert_many(items)
+
+    assert [hit[0] for hit in await exact.search(query, 1, {})] == ["a"]
+    # top_k=1 shortlists two rows, b and c, by sign bits; c scores best.
+    assert [hit[0] for hit in await prefiltered.search(query, 1, {})] == ["c"]
+    # A shortlist covering every candidate is the exhaustive search.
+    assert [hit[0] for hit in await prefiltered.search(query, 1, {"k": "x"})] == ["a"]
+
+
+def test_rerank_multiplier_must_be_positive():
+    with pytest.raises(ValueError, match="rerank_multiplier"):
+        InMemoryBackend(rerank_multiplier=0)
+
+
+def test_backend_exports_resolve_lazily_to_the_backend_classes():
+    import railtracks.retrieval.stores as stores
+    import railtracks.retrieval.stores.vector.backends as backends
+
+    assert backends.InMemoryBackend is InMemoryBackend
+    assert stores.InMemoryVectorBackend is InMemoryBackend
+    assert stores.ChromaBackend is backends.ChromaBackend
+    with pytest.raises(AttributeError):
+        backends.NoSuchBackend  # noqa: B018
@@ -47,3 +47,27 @@ def test_embedded_retrieved_and_result():
     result = RetrievalResult(query="q", chunks=[retrieved])
     assert result.total_candidates is None
     assert result.metadata == {}
+
+
+def test_chunk_level_models_are_slotted():
+    chunk = Chunk(content="c", document_id=Document(content="c").id)
+    embedded = EmbeddedChunk(chunk=chunk, vector=[0.1], embedding_model="toy")
+    retrieved = RetrievedChunk(chunk=chunk, score=0.9, rank=0)
+    for obj in (chunk, embedded, retrieved):
+        assert not hasattr(obj, "__dict__")
+
+
+def test_domain_types_have_a_single_definition():
+    """Chunks produced by chunkers are the same class the package exports.
+
+    Guards against a duplicated module defining a second ``Chunk`` class,
+    which would silently break ``isinstance`` checks downstream.
+    """
+    from railtracks.retrieval.chunking import IdentityChunker
+    from railtracks.retrieval.chunking.base import Chunker
+
+    assert Chunk.__module__ == "railtracks.retrieval.models"
+    assert Chunker.__module__ == "railtracks.retrieval.chunking.base"
+
+    chunks = IdentityChunker().chunk(Document(content="hello", type="text"))
+    assert all(type(c) is Chunk for c in chunks)
@@ -8,6 +8,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncGenerator
 from uuid import uuid4
 
@@ -30,7 +31,7 @@
     Sanitizer,
     SanitizingLoader,
 )
-from railtracks.retrieval.models import Chunk
+from railtracks.retrieval.models import Chunk, EmbeddedChunk
 from railtracks.retrieval.runtime import _content_hash
 from railtracks.retrieval.stores.models import StoreEntry
 from railtracks.retrieval.stores.vector.backends.in_memory import InMemoryBackend
@@ -151,6 +152,75 @@ async def test_ingest_writes_one_entry_per_chunk():
     assert len(found) == 3
 
 
+async def test_ingest_writes_each_batch_with_one_store_call():
+    store = _store()
+    calls: list[int] = []
+
+    real_write_many = store.write_many
+
+    async def tracking_write_many(entries):
+        calls.append(len(entries))
+        return await real_write_many(entries)
+
+    store.write_many = tracking_write_many  # type: ignore[method-assign]
+
+    runtime, _, _ = _runtime(store=store)
+    doc = Document(content="alpha beta gamma")  # 3 chunks -> batches of 2 + 1
+    async for _ in runtime.ingest(_ListLoader([doc])):
+        pass
+
+    assert calls == [2, 1]
+
+
+async def test_ingest_embeds_next_batch_while_writing_current():
+    store = _store()
+    events: list[str] = []
+    real_write_many = store.write_many
+
+    class _RecordingEmbedder(_FakeEmbedder):
+        async def aembed(self, texts: list[str]) -> TextEmbeddings:
+            events.append(f"embed {texts[0]}")
+            return await super().aembed(texts)
+
+    async def slow_write_many(entries):
+        events.append("write start")
+        await asyncio.sleep(0.01)
+        await real_write_many(entries)
+        events.append("write end")
+
+    store.write_many = slow_write_many  # type: ignore[method-assign]
+
+    runtime, _, _ = _runtime(store=store, embedder=_RecordingEmbedder())
+    doc = Document(content="alpha beta gamma delta")  # 2 batches
+    async for _ in runtime.ingest(_ListLoader([doc])):
+        pass
+
+    # Batch 2 is embedded while batch 1's write is still in flight.
+    assert events.index("embed gamma") < events.index("write end")
+    assert await store.count() == 4
+
+
+async def test_ingest_falls_back_to_write_without_write_many():
+    class _WriteOnlyStore:
+        """Store protocol implementation without the optional write_many."""
+
+        def __init__(self) -> None:
+            self._inner = _store()
+
+        def __getattr__(self, name):
+            if name == "write_many":
+                raise AttributeError(name)
+            return getattr(self._inner, name)
+
+    store = _WriteOnlyStore()
+    runtime, _, _ = _runtime(store=store)  # type: ignore[arg-type]
+    doc = Document(content="alpha beta gamma")
+    async for _ in runtime.ingest(_ListLoader([doc])):
+        pass
+
+    assert len(await store.find({"document_id": str(doc.id)}, limit=10)) == 3
+
+
 async def test_reingest_replaces_prior_version():
     """Upsert: re-ingesting a doc replaces all its chunks atomically per-doc
     (modulo crash mid-write, which is documented)."""
@@ -487,6 +557,169 @@ async def test_retrieve_returns_chunks_ranked():
     assert [c.rank for c in result.chunks] == list(range(len(result.chunks)))
 
 
+async def test_retrieve_many_matches_retrieve_and_embeds_once():
+    runtime, _, embedder = _runtime()
+    await runtime.ingest_all(
+        _ListLoader([Document(content="alpha beta gamma"), Document(content="delta")])
+    )
+    embedder.calls.clear()
+
+    results = await runtime.retrieve_many(["alpha", "delta"], top_k=2)
+
+    assert embedder.calls == [["alpha", "delta"]]
+    assert [r.query for r in results] == ["alpha", "delta"]
+    for result in results:
+        single = await runtime.retrieve(result.query, top_k=2)
+        assert [c.chunk.id for c in result.chunks] == [
+            c.chunk.id for c in single.chunks
+        ]
+
+
+async def test_retrieve_many_accepts_any_sequence():
+    runtime, _, embedder = _runtime()
+    await runtime.ingest_all(_ListLoader([Document(content="alpha delta")]))
+    embedder.calls.clear()
+
+    results = await runtime.retrieve_many(("alpha", "delta"))
+
+    assert isinstance(results, list)
+    assert embedder.calls == [["alpha", "delta"]]
+    assert [r.query for r in results] == ["alpha", "delta"]
+
+
+async def test_retrieve_many_dedupes_repeated_queries():
+    runtime, _, embedder = _runtime()
+    await runtime.ingest_all(_ListLoader([Document(content="alpha delta")]))
+    embedder.calls.clear()
+
+    results = await runtime.retrieve_many(["alpha", "delta", "alpha"])
+
+    assert embedder.calls == [["alpha", "delta"]]
+    assert [r.query for r in results] == ["alpha", "delta", "alpha"]
+    assert results[0] is results[2]
+
+
+async def test_retrieve_many_without_dedupe_runs_every_query():
+    runtime, _, embedder = _runtime()
+    await runtime.ingest_all(_ListLoader([Document(content="alpha delta")]))
+    embedder.calls.clear()
+
+    results = await runtime.retrieve_many(["alpha", "alpha"], dedupe=False)
+
+    assert embedder.calls == [["alpha", "alpha"]]
+    assert results[0] is not results[1]
+
+
+async def test_query_cache_skips_embedder_for_repeated_queries():
+    embedder = _FakeEmbedder()
+    runtime = RetrievalRuntime(
+        chunker=_OneChunkPerWordChunker(),
+        embedder=embedder,
+        store=_store(),
+        query_cache_size=2,
+    )
+    await runtime.ingest_all(_ListLoader([Document(content="alpha delta")]))
+    embedder.calls.clear()
+
+    first = await runtime.retrieve("alpha")
+    again = await runtime.retrieve("alpha")
+    await runtime.retrieve_many(["alpha", "delta"])
+    await runtime.retrieve_many(["gamma", "beta"])  # evicts alpha and delta
+    await runtime.retrieve("alpha")
+
+    assert embedder.calls == [["alpha"], ["delta"], ["gamma", "beta"], ["alpha"]]
+    assert [c.chunk.id for c in again.chunks] == [c.chunk.id for c in first.chunks]
+
+
+async def test_query_cache_still_enforces_captured_model():
+    embedder = _FakeEmbedder()
+    runtime = RetrievalRuntime(
+        chunker=_OneChunkPerWordChunker(),
+        embedder=embedder,
+        store=_store(),
+        query_cache_size=4,
+    )
+    await runtime.retrieve("alpha")  # cached before any model is captured
+    await runtime.ingest_all(_ListLoader([Document(content="alpha")]))
+    runtime._captured_model = "other-model"
+
+    with pytest.raises(EmbeddingModelMismatchError):
+        await runtime.retrieve("alpha")
+
+
+async def test_write_embedded_skips_embedder_and_is_retrievable():
+    runtime, store, embedder = _runtime()
+    doc_id = uuid4()
+    chunks = [
+        EmbeddedChunk(
+            chunk=Chunk(content=word, document_id=doc_id, index=i),
+            vector=vector,
+            embedding_model="fake-model-1",
+        )
+        for i, (word, vector) in enumerate(
+            [("alpha", [1.0, 0.0, 0.0]), ("beta", [0.0, 1.0, 0.0])]
+        )
+    ]
+
+    await runtime.write_embedded(chunks)
+
+    assert embedder.calls == []
+    assert await store.count({"document_id": str(doc_id)}) == 2
+    result = await runtime.retrieve("alpha", top_k=1)
+    assert result.chunks[0].chunk.content == "alpha"
+
+
+async def test_write_embedded_rejects_mismatched_model():
+    runtime, store, _ = _runtime()
+    await runtime.ingest_all(_ListLoader([Document(content="alpha")]))
+    foreign = EmbeddedChunk(
+        chunk=Chunk(content="beta", document_id=uuid4()),
+        vector=[1.0, 0.0, 0.0],
+        embedding_model="other-model",
+    )
+
+    with pytest.raises(EmbeddingModelMismatchError):
+        await runtime.write_embedded([foreign])
+    assert await store.count() == 1
+
+
+async def test_write_embedded_mixed_models_on_fresh_runtime_captures_nothing():
+    runtime, store, _ = _runtime()
+    doc_id = uuid4()
+    mixed = [
+        EmbeddedChunk(
+            chunk=Chunk(content=word, document_id=doc_id, index=i),
+            vector=[1.0, 0.0, 0.0],
+            embedding_model=model,
+        )
+        for i, (word, model) in enumerate([("alpha", "model-a"), ("beta", "model-b")])
+    ]
+
+    with pytest.raises(EmbeddingModelMismatchError):
+        await runtime.write_embedded(mixed)
+    assert await store.count() == 0
+    assert runtime._captured_model is None
+
+    await runtime.write_embedded([mixed[1]])
+    assert await store.count() == 1
+
+
+async def test_retrieve_many_empty_skips_embedder():
+    runtime, _, embedder = _runtime()
+
+    assert await runtime.retrieve_many([]) == []
+    assert embedder.calls == []
+
+
+async def test_retrieve_many_raises_on_model_mismatch():
+    runtime, _, _ = _runtime(embedder=_FakeEmbedder(model="model-v1"))
+    await runtime.ingest_all(_ListLoader([Document(content="alpha beta")]))
+    runtime._embedder = _FakeEmbedder(model="model-v2")  # type: ignore[attr-defined]
+
+    with pytest.raises(EmbeddingModelMismatchError):
+        await runtime.retrieve_many(["alpha", "beta"])
+
+
 # ---------------------------------------------------------------------------
 # Phase 4a — Staleness detection
 # ---------------------------------------------------------------------------
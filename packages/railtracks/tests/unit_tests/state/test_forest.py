@@ -103,6 +103,11 @@ def test_start_of_time(example_structure):
     assert forest[i_1] == data["1"][0]
     assert forest[i_2] == data["2"][0]
     assert i_3 not in forest
+
+def test_time_machine_returns_the_forest_on_every_path(example_structure):
+    forest, _ = example_structure
+    assert forest.time_machine(step=None) is forest
+    assert forest.time_machine(step=1) is forest
 # ================ END time_machine tests ===============
 
 # ================= START heap update/validation tests ============
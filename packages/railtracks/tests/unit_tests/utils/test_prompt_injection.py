@@ -77,4 +77,32 @@ def test_inject_values_catches_valueerror(monkeypatch):
     result = prompt_injection.inject_values(history, value_dict)
     assert result[0].content == "Hello, {name}!"
 
-# ================ END inject_values tests ==================
\ No newline at end of file
+# ================ END inject_values tests ==================
+
+# ================= START template caching tests =============
+
+def test_formatter_reuses_parsed_template():
+    prompt_injection_utils._parse_template.cache_clear()
+    f = KeyOnlyFormatter()
+    assert f.format("Hi {name}", name="A") == "Hi A"
+    misses = prompt_injection_utils._parse_template.cache_info().misses
+    assert f.format("Hi {name}", name="B") == "Hi B"
+    assert prompt_injection_utils._parse_template.cache_info().misses == misses
+
+def test_formatter_cached_parse_keeps_escapes():
+    f = KeyOnlyFormatter()
+    assert f.format("{{literal}} {name}", name="x") == "{literal} x"
+    assert f.format("{{literal}} {name}", name="y") == "{literal} y"
+
+def test_fill_prompt_skips_content_without_braces(monkeypatch):
+    msg = UserMessage(content="No placeholders here", inject_prompt=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("formatter should not run")
+
+    monkeypatch.setattr(KeyOnlyFormatter, "vformat", fail)
+    prompt_injection.inject_values(MessageHistory([msg]), ValueDict({"name": "Alice"}))
+    assert msg.content == "No placeholders here"
+    assert msg.inject_prompt is False
+
+# ================ END template caching tests ================